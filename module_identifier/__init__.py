@@ -1,6 +1,9 @@
-from .discover import discover_modules
-from .identify import identify_repo
-from .models import DiscoveredModule, Ecosystem, Manifest
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .discover import discover_modules
+    from .identify import identify_repo
+    from .models import DiscoveredModule, Ecosystem, Manifest
 
 __all__ = [
     "discover_modules",
@@ -9,3 +12,23 @@ __all__ = [
     "Ecosystem",
     "Manifest",
 ]
+
+# Public API is resolved lazily so `python -m module_identifier --help`
+# doesn't pay for pydantic/mcp imports before argparse runs.
+_LAZY_ATTRS = {
+    "discover_modules": ".discover",
+    "identify_repo": ".identify",
+    "DiscoveredModule": ".models",
+    "Ecosystem": ".models",
+    "Manifest": ".models",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,27 +1,164 @@
 """CLI entry point: python -m module_identifier /path/to/repo"""
 
 import argparse
-import asyncio
-import json
 import logging
+import os
 import sys
 import time
-from pathlib import Path
-
-from dotenv import load_dotenv
-from mcp import McpError
 
 from .config import ContrastConfig
-from .identify import identify_repo
-from .llm import LLMConfig
-from .pipeline import run
+
+# Heavy imports (dotenv, asyncio, mcp, pydantic-ai) are deferred until after
+# argument parsing so --help and usage errors return without loading them.
 
 log = logging.getLogger(__name__)
 
+EXIT_FAILURE = 1
 
-def main():
-    load_dotenv()
+# --single error reporting: exception type → stderr message. Looked up along the
+# exception's MRO, so subclasses (FileNotFoundError, ConnectionRefusedError) get
+# their nearest listed base; PermissionError etc. win over their OSError base.
+_SINGLE_ERRORS = {
+    PermissionError: lambda e, repo_path: f"Cannot read repository at {repo_path}.",
+    TimeoutError: lambda e, repo_path: "Timeout connecting to Contrast.",
+    ConnectionError: lambda e, repo_path: "Cannot connect to Contrast MCP server.",
+    OSError: lambda e, repo_path: (
+        "Cannot start Contrast MCP server. "
+        "Verify MCP_CONTRAST_JAR_PATH or that Java/Docker is installed."
+    ),
+}
+
+
+def _async_runner():
+    """Return uvloop.run when the optional uvloop extra is installed, else asyncio.run."""
+    try:
+        import uvloop
+    except ModuleNotFoundError:
+        import asyncio
+        return asyncio.run
+    return uvloop.run
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write bytes to path (truncating) with raw os.write, bypassing buffered IO."""
+    # 0o666 like open(path, "w"): the user's umask decides the final mode
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _dump_json(output: dict) -> bytes:
+    """Serialize CLI output as indented JSON, using orjson when installed."""
+    try:
+        import orjson
+    except ModuleNotFoundError:
+        import json
+        return json.dumps(output, indent=2).encode("utf-8")
+    return orjson.dumps(output, option=orjson.OPT_INDENT_2)
+
+
+def _app_cache_ttl(args):
+    """Org app list cache TTL for this run, or None when --no-cache is set."""
+    from .cache import DEFAULT_APP_CACHE_TTL
+
+    return None if args.no_cache else DEFAULT_APP_CACHE_TTL
+
+
+def _single_error_message(e: Exception, repo_path: str) -> str:
+    """Map an exception from identify_repo to the user-facing error line."""
+    from mcp import McpError
+
+    if isinstance(e, McpError):
+        return f"Contrast API error: {e}"
+    for cls in type(e).__mro__:
+        message = _SINGLE_ERRORS.get(cls)
+        if message is not None:
+            return message(e, repo_path)
+    return f"Unexpected error: {type(e).__name__}: {e}"
+
+
+def _run_single(args, repo_path, contrast_config, llm_config) -> dict:
+    """EA mode: resolve the repo to a single app_id."""
+    from .identify import identify_repo
+
+    threshold = args.threshold if args.threshold is not None else 0.7
+    # Tracebacks are only logged with --debug; skip capturing them otherwise
+    debug = log.isEnabledFor(logging.DEBUG)
+    t0 = time.perf_counter_ns()
+    try:
+        match = _async_runner()(identify_repo(
+            repo_path=repo_path,
+            config=contrast_config,
+            llm_config=llm_config,
+            confidence_threshold=threshold,
+            app_cache_ttl=_app_cache_ttl(args),
+        ))
+    except Exception as e:
+        print(_single_error_message(e, repo_path), file=sys.stderr)
+        if debug:
+            log.debug("%s detail: %s", type(e).__name__, e, exc_info=True)
+        sys.exit(EXIT_FAILURE)
+
+    elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+
+    return {
+        "repo_path": repo_path,
+        "app_id": match.app_id if match else None,
+        "app_name": match.app_name if match else None,
+        "confidence": match.confidence if match else None,
+        "source": match.source if match else None,
+        "execution_time_ms": round(elapsed_ms, 1),
+    }
+
+
+def _run_modules(args, repo_path, contrast_config, llm_config) -> dict:
+    """Module-level mode: resolve every discovered module."""
+    from .pipeline import run
+
+    threshold = args.threshold if args.threshold is not None else 0.5
+    t0 = time.perf_counter_ns()
+    result = _async_runner()(run(
+        repo_path=repo_path,
+        config=contrast_config,
+        llm_config=llm_config,
+        confidence_threshold=threshold,
+        depth=args.depth,
+        max_concurrency=args.max_concurrency,
+        app_cache_ttl=_app_cache_ttl(args),
+    ))
+    elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+
+    return {
+        "repo_path": repo_path,
+        **result.as_payload(),
+        "execution_time_ms": round(elapsed_ms, 1),
+    }
+
+
+def _emit(output: dict, args) -> None:
+    """Write the requested output files for either mode."""
+    if args.output:
+        _write_file(args.output, _dump_json(output))
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+    if args.output_env:
+        app_id = output.get("app_id") or ""
+        _write_file(args.output_env, f"APP_ID={app_id}\n".encode())
+        print(f"Env written to {args.output_env}", file=sys.stderr)
 
+
+# Each mode imports only its own dependencies when dispatched
+_MODES = {
+    "single": _run_single,
+    "modules": _run_modules,
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Discover modules in a repo and resolve them to Contrast app IDs.",
     )
@@ -43,11 +180,27 @@ def main():
         default=4,
         help="Max directory depth for module discovery (default: 4)",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=3,
+        help="Max concurrent LLM agent runs for unmatched modules (default: 3)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch the Contrast app list instead of reusing one cached in the last 5 minutes",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Suppress progress logging (warnings and errors are still shown)",
+    )
     parser.add_argument(
         "--single",
         action="store_true",
@@ -61,128 +214,53 @@ def main():
         "--output-env",
         help="Write APP_ID=<value> to file (for CI consumption)",
     )
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main():
+    args = _PARSER.parse_args()
 
     if args.output_env and not args.single:
         print("Error: --output-env requires --single mode", file=sys.stderr)
-        sys.exit(1)
+        sys.exit(EXIT_FAILURE)
 
-    level = logging.DEBUG if args.debug else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(name)s %(levelname)s %(message)s",
-        stream=sys.stderr,
-    )
+    # --quiet skips handler/formatter setup entirely; warnings still reach
+    # stderr through logging.lastResort at the root logger's default level.
+    if args.debug or not args.quiet:
+        logging.basicConfig(
+            level=logging.DEBUG if args.debug else logging.INFO,
+            format="%(name)s %(levelname)s %(message)s",
+            stream=sys.stderr,
+            force=True,
+        )
+
+    repo_path = os.path.realpath(args.repo_path)
 
-    repo_path = str(Path(args.repo_path).resolve())
+    from dotenv import load_dotenv
+
+    from .llm.config import LLMConfig
+
+    load_dotenv()
 
     try:
         contrast_config = ContrastConfig.from_env()
     except ValueError as e:
         print(f"Contrast config error: {e}", file=sys.stderr)
-        sys.exit(1)
+        sys.exit(EXIT_FAILURE)
 
     try:
         llm_config = LLMConfig.from_env()
     except ValueError as e:
         print(f"LLM config error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    t0 = time.time()
-
-    if args.single:
-        threshold = args.threshold if args.threshold is not None else 0.7
-        try:
-            match = asyncio.run(identify_repo(
-                repo_path=repo_path,
-                config=contrast_config,
-                llm_config=llm_config,
-                confidence_threshold=threshold,
-            ))
-        except PermissionError:
-            print(f"Cannot read repository at {repo_path}.", file=sys.stderr)
-            log.debug("PermissionError for %s", repo_path, exc_info=True)
-            sys.exit(1)
-        except McpError as e:
-            print(f"Contrast API error: {e}", file=sys.stderr)
-            log.debug("McpError detail", exc_info=True)
-            sys.exit(1)
-        except TimeoutError:
-            print("Timeout connecting to Contrast.", file=sys.stderr)
-            log.debug("TimeoutError", exc_info=True)
-            sys.exit(1)
-        except ConnectionError as e:
-            print("Cannot connect to Contrast MCP server.", file=sys.stderr)
-            log.debug("ConnectionError detail: %s", e, exc_info=True)
-            sys.exit(1)
-        except OSError as e:
-            print(
-                "Cannot start Contrast MCP server. "
-                "Verify MCP_CONTRAST_JAR_PATH or that Java/Docker is installed.",
-                file=sys.stderr,
-            )
-            log.debug("OSError detail: %s", e, exc_info=True)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Unexpected error: {type(e).__name__}: {e}", file=sys.stderr)
-            log.debug("Unexpected exception", exc_info=True)
-            sys.exit(1)
-
-        elapsed_ms = (time.time() - t0) * 1000
-
-        output = {
-            "repo_path": repo_path,
-            "app_id": match.app_id if match else None,
-            "app_name": match.app_name if match else None,
-            "confidence": match.confidence if match else None,
-            "source": match.source if match else None,
-            "execution_time_ms": round(elapsed_ms, 1),
-        }
-    else:
-        threshold = args.threshold if args.threshold is not None else 0.5
-        result = asyncio.run(run(
-            repo_path=repo_path,
-            config=contrast_config,
-            llm_config=llm_config,
-            confidence_threshold=threshold,
-            depth=args.depth,
-        ))
-        elapsed_ms = (time.time() - t0) * 1000
-
-        output = {
-            "repo_path": repo_path,
-            "total_modules": result.total,
-            "deterministic_matched": {
-                path: {
-                    "app_id": m.app_id,
-                    "app_name": m.app_name,
-                    "confidence": m.confidence,
-                    "search_term": m.search_term,
-                }
-                for path, m in result.matched.items()
-            },
-            "llm_matched": {
-                path: {
-                    "app_id": m.application_id,
-                    "app_name": m.application_name,
-                    "confidence": m.confidence,
-                    "reasoning": m.reasoning,
-                }
-                for path, m in result.llm_matched.items()
-            },
-            "unmatched": result.unmatched,
-            "execution_time_ms": round(elapsed_ms, 1),
-        }
+        sys.exit(EXIT_FAILURE)
 
-    if args.output:
-        json_str = json.dumps(output, indent=2)
-        Path(args.output).write_text(json_str)
-        print(f"Results written to {args.output}", file=sys.stderr)
+    mode = "single" if args.single else "modules"
+    output = _MODES[mode](args, repo_path, contrast_config, llm_config)
 
-    if args.output_env:
-        app_id = output.get("app_id") or ""
-        Path(args.output_env).write_text(f"APP_ID={app_id}\n")
-        print(f"Env written to {args.output_env}", file=sys.stderr)
+    _emit(output, args)
 
 
 if __name__ == "__main__":
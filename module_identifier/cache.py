@@ -0,0 +1,99 @@
+"""On-disk cache of the org application list.
+
+Re-running against the same org within the TTL reuses the last
+list_applications() result instead of starting the MCP server and
+paginating the whole org again. Entries are keyed by a hash of host, org
+and the user's credentials (visible apps depend on the user's permissions),
+hold only app id/name/language (no credentials), and are written
+owner-only. Any read or write problem is treated as a cache miss.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Optional
+
+from .config import ContrastConfig
+from .resolver import AppCandidate
+
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    from json import loads as _json_loads
+
+log = logging.getLogger(__name__)
+
+DEFAULT_APP_CACHE_TTL = 300.0  # seconds
+
+
+def _cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "contrast-module-identifier"
+
+
+def _cache_path(config: ContrastConfig) -> Path:
+    material = "\0".join((config.host_name, config.org_id, config.username, config.api_key))
+    key = hashlib.sha256(material.encode()).hexdigest()
+    return _cache_dir() / f"apps-{key[:32]}.json"
+
+
+def load_apps(config: ContrastConfig, ttl: float) -> Optional[list[AppCandidate]]:
+    """Return the cached app list for this org if younger than ttl seconds, else None."""
+    path = _cache_path(config)
+    try:
+        age = time.time() - path.stat().st_mtime
+        # A future mtime (clock skew, copied file) would otherwise never expire
+        if age < 0 or age > ttl:
+            return None
+        rows = _json_loads(path.read_bytes())
+        return [AppCandidate(app_id, name, sys.intern(language)) for app_id, name, language in rows]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def store_apps(config: ContrastConfig, apps: list[AppCandidate]) -> None:
+    """Write the app list for this org, atomically and owner-only."""
+    path = _cache_path(config)
+    data = json.dumps([[a.app_id, a.name, a.language] for a in apps]).encode("utf-8")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".apps-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            # Never let a cleanup failure replace the original error
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+    except OSError as e:
+        log.debug("Could not write app cache %s: %s", path, e)
+
+
+async def cached_apps(
+    config: ContrastConfig,
+    ttl: Optional[float],
+    fetch: Callable[[], Awaitable[list[AppCandidate]]],
+) -> list[AppCandidate]:
+    """Return the org app list from cache when fresh, else from fetch() (then cache it).
+
+    ttl=None disables the cache entirely. Empty results are not cached.
+    """
+    if ttl is None:
+        return await fetch()
+    apps = load_apps(config, ttl)
+    if apps is not None:
+        log.info("Using cached app list (%d apps)", len(apps))
+        return apps
+    apps = await fetch()
+    if apps:
+        store_apps(config, apps)
+    return apps
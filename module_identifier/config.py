@@ -1,26 +1,77 @@
 """Contrast Security credentials from environment."""
 
-import base64
+import binascii
 import os
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 
+# Env vars that must always be set, in the order they are reported when missing.
+_REQUIRED_VARS = ("CONTRAST_HOST_NAME", "CONTRAST_API_KEY", "CONTRAST_ORG_ID")
 
+# Env var names for as_env(), paired positionally with the fields fetched by _env_values.
+_ENV_KEYS = (
+    "CONTRAST_HOST_NAME",
+    "CONTRAST_API_KEY",
+    "CONTRAST_SERVICE_KEY",
+    "CONTRAST_USERNAME",
+    "CONTRAST_ORG_ID",
+)
+_env_values = attrgetter("host_name", "api_key", "service_key", "username", "org_id")
+
+if sys.version_info >= (3, 11):
+    def _strict_b64decode(data: str) -> bytes:
+        return binascii.a2b_base64(data, strict_mode=True)
+else:  # strict_mode is 3.11+; b64decode(validate=True) is the closest equivalent
+    import base64
+
+    def _strict_b64decode(data: str) -> bytes:
+        return base64.b64decode(data, validate=True)
+
+
+@lru_cache(maxsize=4)
 def _decode_auth_token(token: str) -> tuple[str, str]:
-    """Decode base64(username:service_key) into (username, service_key)."""
-    decoded = base64.b64decode(token).decode("utf-8")
-    username, _, service_key = decoded.partition(":")
+    """Decode base64(username:service_key) into (username, service_key).
+
+    Decoding is strict — a token with non-base64 characters fails fast
+    instead of being silently repaired into the wrong credentials.
+    """
+    try:
+        raw = _strict_b64decode(token.strip())
+    except ValueError:  # binascii.Error, or non-ASCII input
+        raise ValueError("CONTRAST_AUTH_TOKEN must be base64(username:service_key)") from None
+    username, _, service_key = raw.partition(b":")
     if not username or not service_key:
         raise ValueError("CONTRAST_AUTH_TOKEN must be base64(username:service_key)")
-    return username, service_key
+    return username.decode("utf-8"), service_key.decode("utf-8")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContrastConfig:
     host_name: str
     api_key: str
     service_key: str
     username: str
     org_id: str
+    # Derived values, precomputed once; fields are frozen so they never go stale.
+    # as_env() mapping
+    _env: dict[str, str] = field(init=False, repr=False, compare=False)
+    # Authorization header for the Contrast LLM proxy: base64(username:service_key)
+    basic_auth_header: str = field(init=False, repr=False, compare=False)
+    # Anthropic-compatible endpoint of the Contrast LLM proxy for this org
+    llm_proxy_url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_env", dict(zip(_ENV_KEYS, _env_values(self))))
+        object.__setattr__(self, "basic_auth_header", binascii.b2a_base64(
+            f"{self.username}:{self.service_key}".encode(), newline=False,
+        ).decode("ascii"))
+        host = self.host_name.rstrip("/")
+        object.__setattr__(
+            self, "llm_proxy_url",
+            f"https://{host}/api/llm-proxy/v2/organizations/{self.org_id}/anthropic",
+        )
 
     @classmethod
     def from_env(cls) -> "ContrastConfig":
@@ -32,24 +83,19 @@ class ContrastConfig:
 
         Always required: CONTRAST_HOST_NAME, CONTRAST_API_KEY, CONTRAST_ORG_ID
         """
-        host_name = os.getenv("CONTRAST_HOST_NAME", "")
-        api_key = os.getenv("CONTRAST_API_KEY", "")
-        org_id = os.getenv("CONTRAST_ORG_ID", "")
-        username = os.getenv("CONTRAST_USERNAME", "")
-        service_key = os.getenv("CONTRAST_SERVICE_KEY", "")
-        auth_token = os.getenv("CONTRAST_AUTH_TOKEN", "")
+        env = os.environ
+        host_name = env.get("CONTRAST_HOST_NAME", "")
+        api_key = env.get("CONTRAST_API_KEY", "")
+        org_id = env.get("CONTRAST_ORG_ID", "")
+        username = env.get("CONTRAST_USERNAME", "")
+        service_key = env.get("CONTRAST_SERVICE_KEY", "")
+        auth_token = env.get("CONTRAST_AUTH_TOKEN", "")
 
         # Derive username/service_key from auth token if not provided directly
         if auth_token and (not username or not service_key):
             username, service_key = _decode_auth_token(auth_token)
 
-        missing = []
-        if not host_name:
-            missing.append("CONTRAST_HOST_NAME")
-        if not api_key:
-            missing.append("CONTRAST_API_KEY")
-        if not org_id:
-            missing.append("CONTRAST_ORG_ID")
+        missing = [var for var in _REQUIRED_VARS if not env.get(var)]
         if not username or not service_key:
             missing.append("CONTRAST_AUTH_TOKEN (or CONTRAST_USERNAME + CONTRAST_SERVICE_KEY)")
         if missing:
@@ -71,11 +117,16 @@ class ContrastConfig:
         )
 
     def as_env(self) -> dict[str, str]:
-        """Return as env dict for passing to subprocess."""
-        return {
-            "CONTRAST_HOST_NAME": self.host_name,
-            "CONTRAST_API_KEY": self.api_key,
-            "CONTRAST_SERVICE_KEY": self.service_key,
-            "CONTRAST_USERNAME": self.username,
-            "CONTRAST_ORG_ID": self.org_id,
-        }
+        """Return as env dict for passing to subprocess.
+
+        Returns a fresh copy of the cached mapping.
+        """
+        return self._env.copy()
+
+    def subprocess_env(self) -> dict[str, str]:
+        """Return the full env for an MCP server subprocess: credentials + PATH.
+
+        Built in one step from the cached mapping. PATH is read at call time
+        so changes to os.environ after construction are still honoured.
+        """
+        return {**self._env, "PATH": os.environ.get("PATH", "")}
@@ -1,12 +1,113 @@
-import json
+import os
 import re
 # stdlib ElementTree is not vulnerable to XXE (no external entity support)
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Optional
 
 from .models import DiscoveredModule, Ecosystem, Manifest
-from .scanner import _name_from_package_json, _name_from_pom_xml, _name_from_gradle
+from .scanner import _extract_name
+
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    from json import loads as _json_loads
+
+# XML namespace prefix of a root tag: "{http://maven.apache.org/POM/4.0.0}project"
+_NS_RE = re.compile(r"\{(.+)\}")
+# Gradle settings includes, scanned in one pass. Alternatives, in order:
+#   full-line // comment (skipped)
+#   include("mod1", "mod2")                -> group 1
+#   include ":mod1", ":mod2"  (Groovy)     -> group 2
+# Inside include(...) whole comment lines are stepped over, so a ")" in a
+# commented-out line doesn't end the argument list early.
+_GRADLE_SETTINGS_RE = re.compile(
+    r'^[ \t]*//[^\n]*'
+    r'|include\s*\(((?:^[ \t]*//[^\n]*\n|[^)])+)\)'
+    r'|include\s+([^(\n]+)',
+    re.MULTILINE,
+)
+# findProject(":path")?.name = "new" -> groups 1, 2; full-line comments skipped.
+# A separate scan: the bare include branch above runs to the next "(", so it
+# would swallow a rename that follows an include on the same line.
+_GRADLE_RENAME_RE = re.compile(
+    r'^[ \t]*//[^\n]*'
+    r'|findProject\(\s*["\']([^"\']+)["\']\s*\)\??\s*\.\s*name\s*=\s*["\']([^"\']+)["\']',
+    re.MULTILINE,
+)
+# Quoted include() arguments; commented-out lines inside the parens are skipped
+_INCLUDE_ARG_RE = re.compile(r'^[ \t]*//[^\n]*|["\']([^"\']+)["\']', re.MULTILINE)
+# Workspace entries containing any of these need Path.glob; the rest are literal paths
+_GLOB_CHARS = frozenset("*?[")
+# .sln: Project("{...}") = "Name", "path\to\project.csproj", "{...}"
+_SLN_PROJECT_RE = re.compile(r'Project\("[^"]*"\)\s*=\s*"([^"]+)"\s*,\s*"([^"]+)"')
+
+
+def _contained_realpath(root: str, path: str | Path) -> Optional[str]:
+    """Return realpath(path) if it lies inside root, else None.
+
+    root must already be a realpath (resolve it once per scan, not per
+    entry). realpath rather than normpath so symlinks that point outside
+    the repo are still rejected. Paths that cannot exist (embedded NUL)
+    are treated as outside.
+    """
+    try:
+        real = os.path.realpath(path)
+    except ValueError:
+        return None
+    if real == root or real.startswith(os.path.join(root, "")):
+        return real
+    return None
+
+
+class _StatCache:
+    """Stat results for one scan.
+
+    A repo declaring the same directory in several manifests (e.g. Maven and
+    Gradle side by side) is only stat'd once. Created per discover call and
+    dropped with it, so answers never outlive the scan.
+    """
+
+    __slots__ = ("_isdir", "_isfile", "_subdirs")
+
+    def __init__(self) -> None:
+        self._isdir: dict[str, bool] = {}
+        self._isfile: dict[str, bool] = {}
+        self._subdirs: dict[str, frozenset[str]] = {}
+
+    def isdir(self, path: str) -> bool:
+        cached = self._isdir.get(path)
+        if cached is None:
+            cached = self._isdir[path] = os.path.isdir(path)
+        return cached
+
+    def isfile(self, path: str) -> bool:
+        cached = self._isfile.get(path)
+        if cached is None:
+            cached = self._isfile[path] = os.path.isfile(path)
+        return cached
+
+    def subdirs(self, path: str) -> frozenset[str]:
+        """Names of the directories directly under path, from one scandir."""
+        cached = self._subdirs.get(path)
+        if cached is None:
+            try:
+                with os.scandir(path) as it:
+                    cached = frozenset(entry.name for entry in it if entry.is_dir())
+            except (OSError, ValueError):
+                cached = frozenset()
+            self._subdirs[path] = cached
+        return cached
+
+
+def _root_files(repo_root: Path) -> frozenset[str]:
+    """Names of the regular files directly under repo_root, from one scandir."""
+    try:
+        with os.scandir(repo_root) as it:
+            return frozenset(entry.name for entry in it if entry.is_file())
+    except OSError:
+        return frozenset()
 
 
 def discover_declared_modules(repo_root: Path) -> list[DiscoveredModule]:
@@ -26,64 +127,110 @@ def discover_declared_modules(repo_root: Path) -> list[DiscoveredModule]:
         List of discovered modules from explicit declarations.
     """
     results: list[DiscoveredModule] = []
+    # Resolved once and shared by every helper's containment checks
+    root = os.path.realpath(repo_root)
+    # One readdir answers every helper's "is this manifest here?" question
+    files = _root_files(repo_root)
+    stats = _StatCache()
 
-    results.extend(_maven_modules(repo_root))
-    results.extend(_gradle_modules(repo_root))
-    results.extend(_node_workspaces(repo_root))
-    results.extend(_dotnet_solution_projects(repo_root))
+    results.extend(_maven_modules(repo_root, root, files, stats))
+    results.extend(_gradle_modules(repo_root, root, files, stats))
+    results.extend(_node_workspaces(repo_root, root, files, stats))
+    results.extend(_dotnet_solution_projects(repo_root, root, files, stats))
 
     return results
 
 
-def _maven_modules(repo_root: Path) -> list[DiscoveredModule]:
+def _maven_modules(
+    repo_root: Path,
+    root: Optional[str] = None,
+    files: Optional[frozenset[str]] = None,
+    stats: Optional[_StatCache] = None,
+) -> list[DiscoveredModule]:
     """Parse <modules> from parent pom.xml."""
-    pom_path = repo_root / "pom.xml"
-    if not pom_path.is_file():
+    if files is None:
+        files = _root_files(repo_root)
+    if stats is None:
+        stats = _StatCache()
+    if "pom.xml" not in files:
         return []
+    pom_path = repo_root / "pom.xml"
 
     try:
-        tree = ET.parse(pom_path)
-        root = tree.getroot()
-        ns = ""
-        match = re.match(r"\{(.+)\}", root.tag)
-        if match:
-            ns = f"{{{match.group(1)}}}"
-
-        modules_el = root.find(f"{ns}modules")
-        if modules_el is None:
-            return []
-
-        results = []
-        for module_el in modules_el.findall(f"{ns}module"):
-            module_dir = module_el.text
-            if not module_dir:
-                continue
-
-            module_path = (repo_root / module_dir).resolve()
-            if not module_path.is_relative_to(repo_root.resolve()):
-                continue
-            module_pom = module_path / "pom.xml"
-            if module_pom.is_file():
-                name = _name_from_pom_xml(module_pom) or module_path.name
-                results.append(DiscoveredModule(
-                    name=name,
-                    path=module_dir,
-                    manifest=Manifest.POM_XML,
-                    ecosystem=Ecosystem.JAVA,
-                ))
-
-        return results
-    except Exception:
+        module_dirs = _maven_module_dirs(pom_path)
+    except (OSError, ET.ParseError):
         return []
 
+    if root is None:
+        root = os.path.realpath(repo_root)
+
+    results = []
+    for module_dir in module_dirs:
+        if not module_dir:
+            continue
+
+        real = _contained_realpath(root, repo_root / module_dir)
+        if real is None:
+            continue
+        module_path = Path(real)
+        if stats.isfile(str(module_path / "pom.xml")):
+            name = _extract_name(module_path, Manifest.POM_XML) or module_path.name
+            results.append(DiscoveredModule(
+                name=name,
+                path=module_dir,
+                manifest=Manifest.POM_XML,
+                ecosystem=Ecosystem.JAVA,
+            ))
+
+    return results
+
+
+def _maven_module_dirs(pom_path: Path) -> list[str]:
+    """Stream pom.xml and return the text of each top-level <modules>/<module>.
+
+    Stops as soon as the top-level <modules> element closes and clears every
+    other top-level element after it ends, so plugin/dependency sections
+    are never held in memory as a full tree.
+    """
+    modules_tag, module_tag = "modules", "module"
+    depth = 0
+    with pom_path.open("rb") as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if depth == 0:
+                    # Build the qualified tags once from the root's namespace
+                    match = _NS_RE.match(elem.tag)
+                    if match:
+                        ns = f"{{{match.group(1)}}}"
+                        modules_tag, module_tag = f"{ns}modules", f"{ns}module"
+                depth += 1
+                continue
 
-def _gradle_modules(repo_root: Path) -> list[DiscoveredModule]:
+            depth -= 1
+            if depth != 1:
+                continue
+            # A direct child of <project> just ended
+            if elem.tag == modules_tag:
+                return [module_el.text for module_el in elem.findall(module_tag)]
+            elem.clear()
+    return []
+
+
+def _gradle_modules(
+    repo_root: Path,
+    root: Optional[str] = None,
+    files: Optional[frozenset[str]] = None,
+    stats: Optional[_StatCache] = None,
+) -> list[DiscoveredModule]:
     """Parse include() from settings.gradle(.kts)."""
+    if files is None:
+        files = _root_files(repo_root)
+    if stats is None:
+        stats = _StatCache()
     settings_path = None
     for name in ("settings.gradle.kts", "settings.gradle"):
-        candidate = repo_root / name
-        if candidate.is_file():
-            settings_path = candidate
+        if name in files:
+            settings_path = repo_root / name
             break
 
     if not settings_path:
@@ -91,161 +238,199 @@ def _gradle_modules(repo_root: Path) -> list[DiscoveredModule]:
 
     try:
         text = settings_path.read_text(encoding="utf-8")
-        manifest_type = Manifest.SETTINGS_GRADLE_KTS if settings_path.name.endswith(".kts") else Manifest.SETTINGS_GRADLE
-
-        # Strip comments (// to end of line)
-        lines = text.splitlines()
-        uncommented = "\n".join(
-            line for line in lines if not line.strip().startswith("//")
-        )
-
-        # Extract all quoted strings from include() calls
-        # Matches: include("mod1", "mod2") or include ":mod1", ":mod2"
-        included: list[str] = []
-        for match in re.finditer(r'include\s*\(([^)]+)\)', uncommented):
-            args = match.group(1)
-            included.extend(re.findall(r'["\']([^"\']+)["\']', args))
-        # Also match Groovy-style without parens: include ":mod1", ":mod2"
-        for match in re.finditer(r'include\s+([^(\n]+)', uncommented):
-            args = match.group(1)
-            included.extend(re.findall(r'["\']([^"\']+)["\']', args))
-
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        unique: list[str] = []
-        for item in included:
-            if item not in seen:
-                seen.add(item)
-                unique.append(item)
-
-        # Parse findProject renames: findProject(":path")?.name = "new-name"
-        renames: dict[str, str] = {}
-        for match in re.finditer(
-            r'findProject\(\s*["\']([^"\']+)["\']\s*\)\??\s*\.\s*name\s*=\s*["\']([^"\']+)["\']',
-            uncommented,
-        ):
+    except (OSError, UnicodeDecodeError):
+        return []
+    manifest_type = Manifest.SETTINGS_GRADLE_KTS if settings_path.name.endswith(".kts") else Manifest.SETTINGS_GRADLE
+
+    # include() arguments in document order, full-line comments consumed and dropped
+    included: list[str] = []
+    for match in _GRADLE_SETTINGS_RE.finditer(text):
+        args = match.group(1) or match.group(2)
+        if args:
+            included.extend(
+                arg.group(1) for arg in _INCLUDE_ARG_RE.finditer(args) if arg.group(1)
+            )
+
+    # Parse findProject renames: findProject(":path")?.name = "new-name"
+    renames: dict[str, str] = {}
+    for match in _GRADLE_RENAME_RE.finditer(text):
+        if match.group(1):
             renames[match.group(1)] = match.group(2)
 
-        results = []
-        for module_ref in unique:
-            # Gradle uses : as path separator
-            module_dir = module_ref.lstrip(":").replace(":", "/")
-            module_path = (repo_root / module_dir).resolve()
-            if not module_path.is_relative_to(repo_root.resolve()):
-                continue
+    # Deduplicate while preserving order
+    unique = list(dict.fromkeys(included))
 
-            if not module_path.is_dir():
+    if root is None:
+        root = os.path.realpath(repo_root)
+    results = []
+    for module_ref in unique:
+        # Gradle uses : as path separator
+        module_dir = module_ref.lstrip(":").replace(":", "/")
+        parent, _, leaf = module_dir.rpartition("/")
+        if parent and leaf:
+            # Nested include: one scandir per parent directory answers
+            # existence for all of its siblings (":svc:a", ":svc:b", ...)
+            if leaf not in stats.subdirs(os.path.join(repo_root, parent)):
+                continue
+            real = _contained_realpath(root, repo_root / module_dir)
+            if real is None:
+                continue
+        else:
+            real = _contained_realpath(root, repo_root / module_dir)
+            if real is None or not stats.isdir(real):
                 continue
 
-            # Check for a rename, try both with and without leading colon
-            name = renames.get(module_ref) or renames.get(":" + module_ref.lstrip(":"))
-            if not name:
-                # Use last segment as the name
-                name = module_ref.split(":")[-1]
+        # Check for a rename, try both with and without leading colon
+        name = renames.get(module_ref) or renames.get(":" + module_ref.lstrip(":"))
+        if not name:
+            # Use last segment as the name
+            name = module_ref.split(":")[-1]
 
-            results.append(DiscoveredModule(
-                name=name,
-                path=module_dir,
-                manifest=manifest_type,
-                ecosystem=Ecosystem.JAVA,
-            ))
+        results.append(DiscoveredModule(
+            name=name,
+            path=module_dir,
+            manifest=manifest_type,
+            ecosystem=Ecosystem.JAVA,
+        ))
 
-        return results
-    except Exception:
-        return []
+    return results
 
 
-def _node_workspaces(repo_root: Path) -> list[DiscoveredModule]:
+def _node_workspaces(
+    repo_root: Path,
+    root: Optional[str] = None,
+    files: Optional[frozenset[str]] = None,
+    stats: Optional[_StatCache] = None,
+) -> list[DiscoveredModule]:
     """Parse workspaces from root package.json."""
-    pkg_path = repo_root / "package.json"
-    if not pkg_path.is_file():
+    if files is None:
+        files = _root_files(repo_root)
+    if stats is None:
+        stats = _StatCache()
+    if "package.json" not in files:
         return []
+    pkg_path = repo_root / "package.json"
 
     try:
-        data = json.loads(pkg_path.read_text(encoding="utf-8"))
-        workspaces = data.get("workspaces")
-        if not workspaces:
-            return []
-
-        # workspaces can be a list or an object with "packages" key
-        if isinstance(workspaces, dict):
-            workspaces = workspaces.get("packages", [])
-
-        if not isinstance(workspaces, list):
-            return []
-
-        # Expand glob patterns to actual directories
-        results = []
-        for pattern in workspaces:
-            for match_path in sorted(repo_root.glob(pattern)):
-                if not match_path.resolve().is_relative_to(repo_root.resolve()):
-                    continue
-                if not match_path.is_dir():
-                    continue
-                child_pkg = match_path / "package.json"
-                if not child_pkg.is_file():
-                    continue
-
-                rel_path = str(match_path.relative_to(repo_root))
-                name = _name_from_package_json(child_pkg) or match_path.name
-                results.append(DiscoveredModule(
-                    name=name,
-                    path=rel_path,
-                    manifest=Manifest.PACKAGE_JSON,
-                    ecosystem=Ecosystem.NODE,
-                ))
-
-        return results
-    except Exception:
+        data = _json_loads(pkg_path.read_bytes())
+    except (OSError, ValueError):
+        return []
+    if not isinstance(data, dict):
+        return []
+
+    workspaces = data.get("workspaces")
+    if not workspaces:
         return []
 
+    # workspaces can be a list or an object with "packages" key
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages", [])
+
+    if not isinstance(workspaces, list):
+        return []
+
+    # Expand glob patterns to actual directories
+    if root is None:
+        root = os.path.realpath(repo_root)
+    results = []
+    for pattern in workspaces:
+        if not pattern or not isinstance(pattern, str):
+            continue
+        if _GLOB_CHARS.isdisjoint(pattern):
+            # Literal entry ("packages/a"): no glob walk needed
+            match_paths = [repo_root / pattern]
+        else:
+            try:
+                match_paths = sorted(repo_root.glob(pattern))
+            except (OSError, ValueError, NotImplementedError):
+                # Absolute or otherwise unsupported pattern
+                continue
+        for match_path in match_paths:
+            if _contained_realpath(root, match_path) is None:
+                continue
+            if not stats.isdir(str(match_path)):
+                continue
+            if not stats.isfile(str(match_path / "package.json")):
+                continue
+
+            rel_path = str(match_path.relative_to(repo_root))
+            name = _extract_name(match_path, Manifest.PACKAGE_JSON) or match_path.name
+            results.append(DiscoveredModule(
+                name=name,
+                path=rel_path,
+                manifest=Manifest.PACKAGE_JSON,
+                ecosystem=Ecosystem.NODE,
+            ))
+
+    return results
+
 
-def _dotnet_solution_projects(repo_root: Path) -> list[DiscoveredModule]:
+def _dotnet_solution_projects(
+    repo_root: Path,
+    root: Optional[str] = None,
+    files: Optional[frozenset[str]] = None,
+    stats: Optional[_StatCache] = None,
+) -> list[DiscoveredModule]:
     """Parse project references from *.sln files."""
-    sln_files = list(repo_root.glob("*.sln"))
+    if files is None:
+        files = _root_files(repo_root)
+    if stats is None:
+        stats = _StatCache()
+    sln_files = [repo_root / name for name in sorted(files) if name.endswith(".sln")]
     if not sln_files:
         return []
 
+    if root is None:
+        root = os.path.realpath(repo_root)
     results = []
     seen_paths: set[str] = set()
 
-    try:
-        for sln_path in sln_files:
-            text = sln_path.read_text(encoding="utf-8")
-
-            # Match Project lines: Project("{...}") = "Name", "path\to\project.csproj", "{...}"
-            for match in re.finditer(
-                r'Project\("[^"]*"\)\s*=\s*"([^"]+)"\s*,\s*"([^"]+)"',
-                text,
-            ):
-                project_name = match.group(1)
-                project_file = match.group(2)
-
-                # Skip solution folders (they don't have real paths)
-                if not project_file.endswith((".csproj", ".fsproj", ".vbproj")):
-                    continue
-
-                # Normalize path separators
-                project_rel = project_file.replace("\\", "/")
-                module_dir = str(Path(project_rel).parent)
-
-                if module_dir in seen_paths:
-                    continue
-                seen_paths.add(module_dir)
-
-                # Verify directory exists and is within repo
-                if not (repo_root / module_dir).resolve().is_relative_to(repo_root.resolve()):
-                    continue
-                if not (repo_root / module_dir).is_dir():
-                    continue
-
-                results.append(DiscoveredModule(
-                    name=project_name,
-                    path=module_dir,
-                    manifest=Manifest.PACKAGES_CONFIG,
-                    ecosystem=Ecosystem.DOTNET,
-                ))
-
-        return results
-    except Exception:
-        return []
+    for sln_path in sln_files:
+        try:
+            entries = list(_sln_project_entries(sln_path))
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        for project_name, project_file in entries:
+            # Skip solution folders (they don't have real paths)
+            if not project_file.endswith((".csproj", ".fsproj", ".vbproj")):
+                continue
+
+            # Normalize path separators
+            project_rel = project_file.replace("\\", "/")
+            module_dir = str(Path(project_rel).parent)
+
+            if module_dir in seen_paths:
+                continue
+            seen_paths.add(module_dir)
+
+            # Verify directory exists and is within repo
+            real = _contained_realpath(root, repo_root / module_dir)
+            if real is None or not stats.isdir(real):
+                continue
+
+            results.append(DiscoveredModule(
+                name=project_name,
+                path=module_dir,
+                manifest=Manifest.PACKAGES_CONFIG,
+                ecosystem=Ecosystem.DOTNET,
+            ))
+
+    return results
+
+
+def _sln_project_entries(sln_path: Path) -> Iterator[tuple[str, str]]:
+    """Yield (name, project file) from the Project lines of a .sln file.
+
+    Streams the file line by line and only runs the regex on lines that
+    start with Project(, skipping the (often much larger) Global sections.
+    """
+    with sln_path.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.lstrip()
+            if not line.startswith("Project("):
+                continue
+            # Project("{...}") = "Name", "path\to\project.csproj", "{...}"
+            match = _SLN_PROJECT_RE.match(line)
+            if match:
+                yield match.group(1), match.group(2)
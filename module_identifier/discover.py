@@ -1,15 +1,18 @@
-from pathlib import PurePosixPath, Path
+from pathlib import Path
 
 from .declarations import discover_declared_modules
 from .models import DiscoveredModule
 from .scanner import discover_modules as scan_modules, SKIP_DIRS
 
 
+_SKIP_DIRS = frozenset(SKIP_DIRS)
+
+
 def _in_skip_dir(module_path: str) -> bool:
     """Check if any segment of the module path is in the skip list."""
     if module_path == ".":
         return False
-    return any(part in SKIP_DIRS for part in PurePosixPath(module_path).parts)
+    return not _SKIP_DIRS.isdisjoint(module_path.split("/"))
 
 
 def discover_modules(repo_root: Path, depth: int = 4) -> list[DiscoveredModule]:
@@ -4,18 +4,18 @@ Discovers modules, scores all against the Contrast org's app list,
 and returns the single best match. LLM fallback for low-confidence or ambiguous results.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+from .cache import cached_apps
 from .config import ContrastConfig
 from .discover import discover_modules
+from .llm.agent import resolve_module as llm_resolve
 from .mcp_contrast import ContrastMCP
 from .models import DiscoveredModule
-from .resolver import (
-    AppCandidate, AppMatch, extract_search_term,
-    resolve_module, score_candidate,
-)
+from .resolver import AppCandidate, AppMatch, candidate_scorer, extract_search_term
 
 if TYPE_CHECKING:
     from .llm import LLMConfig
@@ -42,36 +42,43 @@ log = logging.getLogger(__name__)
 
 DEFAULT_THRESHOLD = 0.7
 AMBIGUITY_FLOOR = 0.6
-_LLM_CONFIDENCE_MAP = {"HIGH": 0.95, "MEDIUM": 0.80, "LOW": 0.60}
+_LLM_CONFIDENCE_MAP: dict[str, float] = {"HIGH": 0.95, "MEDIUM": 0.80, "LOW": 0.60}
 
 
 def _best_deterministic_match(
     modules: list[DiscoveredModule],
     candidates: list[AppCandidate],
-) -> Optional[AppMatch]:
-    """Score every discovered module against all candidates, return the single best."""
+    floor: float = AMBIGUITY_FLOOR,
+) -> tuple[Optional[AppMatch], bool]:
+    """Score every discovered module against all candidates, return the single best.
+
+    Also reports whether the best module is ambiguous (more than one candidate
+    scores at or above floor), counted in the same scoring pass.
+    """
     best: Optional[AppMatch] = None
+    best_strong = 0
     for module in modules:
-        match = resolve_module(module, candidates, confidence_threshold=0.0)
-        if match and (best is None or match.confidence > best.confidence):
-            best = match
-    return best
-
-
-def _is_ambiguous(
-    module: DiscoveredModule,
-    candidates: list[AppCandidate],
-    floor: float = AMBIGUITY_FLOOR,
-) -> bool:
-    """Check if multiple candidates score above the ambiguity floor for a module."""
-    term = extract_search_term(module)
-    strong = 0
-    for c in candidates:
-        if score_candidate(module, c, term) >= floor:
-            strong += 1
-            if strong > 1:
-                return True
-    return False
+        term = extract_search_term(module)
+        score_fn = candidate_scorer(module, term)
+        strong = 0
+        top: Optional[AppCandidate] = None
+        top_score = 0.0
+        for c in candidates:
+            score = score_fn(c)
+            if score >= floor:
+                strong += 1
+            if score > top_score:
+                top, top_score = c, score
+        if top is not None and (best is None or top_score > best.confidence):
+            best = AppMatch(
+                module=module,
+                app_id=top.app_id,
+                app_name=top.name,
+                confidence=top_score,
+                search_term=term,
+            )
+            best_strong = strong
+    return best, best_strong > 1
 
 
 async def identify_repo(
@@ -80,6 +87,8 @@ async def identify_repo(
     llm_config: "LLMConfig",
     jar_path: str | None = None,
     confidence_threshold: float = DEFAULT_THRESHOLD,
+    mcp: ContrastMCP | None = None,
+    app_cache_ttl: float | None = None,
 ) -> Optional[AppMatch]:
     """Identify the Contrast application for a repository.
 
@@ -92,21 +101,39 @@ async def identify_repo(
         llm_config: LLM provider configuration.
         jar_path: Path to mcp-contrast jar (falls back to Docker).
         confidence_threshold: Minimum confidence (default 0.7).
+        mcp: Already-open ContrastMCP session to reuse. When omitted, a
+            server is started for this call and shut down afterwards.
+        app_cache_ttl: Reuse an on-disk org app list younger than this many
+            seconds instead of fetching it. None (default) always fetches.
 
     Returns:
         AppMatch if found above threshold (or via LLM), None otherwise.
     """
     repo_path = Path(repo_path).resolve()
 
-    # 1. Discover modules (shallow for EA)
-    modules = discover_modules(repo_path, depth=2)
-    log.info("Discovered %d modules in %s", len(modules), repo_path)
-    for m in modules:
-        log.info("  %s (%s) @ %s", m.name, m.ecosystem.value, m.path)
-
-    # 2. Fetch org app list via MCP
-    async with ContrastMCP(config, jar_path=jar_path) as mcp:
-        candidates = await mcp.list_applications()
+    async def fetch_candidates():
+        if mcp is not None:
+            return await mcp.list_applications()
+        async with ContrastMCP(config, jar_path=jar_path) as session:
+            return await session.list_applications()
+
+    # 1. Discover modules (shallow for EA) and 2. fetch the org app list via
+    # MCP, concurrently: the walk runs in a worker thread while the MCP
+    # server starts. If discovery fails, the fetch is cancelled (stopping the
+    # server) before the error propagates.
+    fetch = asyncio.ensure_future(cached_apps(config, app_cache_ttl, fetch_candidates))
+    try:
+        modules = await asyncio.to_thread(discover_modules, repo_path, depth=2)
+    except BaseException:
+        fetch.cancel()
+        await asyncio.gather(fetch, return_exceptions=True)
+        raise
+    candidates = await fetch
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Discovered %d modules in %s%s", len(modules), repo_path,
+            "".join(f"\n  {m.name} ({m.ecosystem.value}) @ {m.path}" for m in modules),
+        )
     log.info("Fetched %d Contrast applications", len(candidates))
 
     if not candidates:
@@ -120,7 +147,7 @@ async def identify_repo(
         return None
 
     # 3. Score all modules, pick the best
-    best = _best_deterministic_match(modules, candidates)
+    best, ambiguous = _best_deterministic_match(modules, candidates)
 
     if best:
         log.info(
@@ -132,7 +159,7 @@ async def identify_repo(
     # 4. Above threshold and unambiguous — done
     # contrast_security.yaml is the strongest signal — skip ambiguity check
     from_yaml = best and best.module.contrast_app_name
-    ambiguous = best and not from_yaml and _is_ambiguous(best.module, candidates)
+    ambiguous = ambiguous and not from_yaml
     if ambiguous:
         log.info("Ambiguous match: multiple candidates above %.1f for %s", AMBIGUITY_FLOOR, best.module.name)
     if from_yaml:
@@ -145,8 +172,6 @@ async def identify_repo(
     # TODO: only the single best module is sent to LLM. In monorepos where a different
     # module is the true match but scored 0, the LLM investigates the wrong one.
     # Acceptable for EA (single app per repo); revisit for GA.
-    from .llm.agent import resolve_module as llm_resolve
-
     target = best.module if best else modules[0]
     log.info("LLM fallback on: %s (%s)", target.name, target.path)
 
@@ -1,11 +1,27 @@
 """LLM fallback agent for resolving modules the deterministic scorer couldn't match."""
 
-from .agent import resolve_modules as llm_resolve_modules
+from typing import TYPE_CHECKING
+
 from .config import LLMConfig
-from .models import LLMMatch
+
+if TYPE_CHECKING:
+    from .agent import resolve_modules as llm_resolve_modules
+    from .models import LLMMatch
 
 __all__ = [
     "llm_resolve_modules",
     "LLMConfig",
     "LLMMatch",
 ]
+
+
+def __getattr__(name: str):
+    # Agent and output model pull in pydantic-ai; defer until actually used.
+    if name == "llm_resolve_modules":
+        from .agent import resolve_modules as value
+    elif name == "LLMMatch":
+        from .models import LLMMatch as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
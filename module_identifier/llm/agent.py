@@ -1,8 +1,11 @@
 """LLM fallback agent for resolving modules that the deterministic scorer couldn't match."""
 
+import asyncio
+import heapq
 import logging
 import re
 import time
+from contextlib import AsyncExitStack
 from typing import Optional
 
 from pydantic_ai import Agent, UsageLimits
@@ -24,6 +27,9 @@ MAX_TOOL_CALLS = 15
 MAX_MESSAGES_BEFORE_TRIM = 20
 MESSAGES_TO_KEEP_AFTER_TRIM = 10
 
+# Concurrent agent runs in resolve_modules — runs in a batch share one set of MCP servers
+DEFAULT_MAX_CONCURRENCY = 3
+
 # How many top candidates to include in agent context
 TOP_N_CANDIDATES = 5
 
@@ -128,20 +134,17 @@ def _score_all_candidates(
     module: DiscoveredModule,
     candidates: list[AppCandidate],
 ) -> list[tuple[AppCandidate, float]]:
-    """Score all candidates and return sorted (desc) list of (candidate, score).
+    """Score all candidates and return the top TOP_N_CANDIDATES as (candidate, score), desc.
 
-    Reuses resolver scoring functions but returns ALL scores (not just the best match)
-    so the LLM agent can see what the deterministic scorer considered.
+    Reuses resolver scoring functions but returns more than the best match so
+    the LLM agent can see what the deterministic scorer considered. Only the
+    top N reach the agent context, so a heap selection replaces a full sort.
     """
-    from ..resolver import extract_search_term, score_candidate
+    from ..resolver import candidate_scorer, extract_search_term
 
-    search_term = extract_search_term(module)
-    scored = [
-        (c, score_candidate(module, c, search_term))
-        for c in candidates
-    ]
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored
+    score_fn = candidate_scorer(module, extract_search_term(module))
+    scored = ((c, score_fn(c)) for c in candidates)
+    return heapq.nlargest(TOP_N_CANDIDATES, scored, key=lambda x: x[1])
 
 
 async def resolve_module(
@@ -152,9 +155,13 @@ async def resolve_module(
     repo_path: str,
     jar_path: str | None = None,
     already_matched: dict[str, AppMatch] | None = None,
+    toolsets: list | None = None,
 ) -> Optional[LLMMatch]:
     """Run the LLM agent to resolve a single unmatched module.
 
+    Pass toolsets to reuse already-running MCP servers; otherwise new ones
+    are created for this run.
+
     Returns:
         LLMMatch if the agent found a match, None if NOT_FOUND.
     """
@@ -186,7 +193,8 @@ async def resolve_module(
 
     # Create model and toolsets
     model = get_model(llm_config, contrast_config=contrast_config)
-    toolsets = await create_mcp_toolsets(contrast_config, repo_path, jar_path)
+    if toolsets is None:
+        toolsets = await create_mcp_toolsets(contrast_config, repo_path, jar_path)
 
     agent = Agent(
         model=model,
@@ -244,24 +252,55 @@ async def resolve_modules(
     repo_path: str,
     jar_path: str | None = None,
     already_matched: dict[str, AppMatch] | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
 ) -> dict[str, Optional[LLMMatch]]:
     """Run the LLM agent on a batch of unmatched modules.
 
-    Returns {module.path: LLMMatch or None} for each module.
+    Modules are resolved concurrently, at most max_concurrency at a time,
+    so N unmatched modules cost roughly N / max_concurrency agent runs of
+    wall time instead of N. The MCP servers are started once for the batch
+    and shared by every run.
+
+    Returns {module.path: LLMMatch or None} for each module, in input order.
     """
-    # TODO(GA): Parallelize with asyncio.gather + semaphore. Sequential is fine for EA
-    # (single module via identify_repo), but GA monorepos with many unmatched modules
-    # will hit a latency cliff (N modules × ~8s each). Use Semaphore(3) to limit
-    # concurrent LLM calls. See PR #2 review comments.
-    results = {}
-    for module in modules:
-        results[module.path] = await resolve_module(
-            module=module,
-            candidates=candidates,
-            llm_config=llm_config,
-            contrast_config=contrast_config,
-            repo_path=repo_path,
-            jar_path=jar_path,
-            already_matched=already_matched,
-        )
-    return results
+    if not modules:
+        return {}
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    toolsets = await create_mcp_toolsets(contrast_config, repo_path, jar_path)
+
+    async def _bounded(module: DiscoveredModule) -> Optional[LLMMatch]:
+        async with semaphore:
+            t0 = time.monotonic()
+            # resolve_module only guards the agent run; model setup and
+            # candidate scoring can still raise. Contain those here so one
+            # failure can't end the gather while sibling runs still use the
+            # shared toolsets.
+            try:
+                return await resolve_module(
+                    module=module,
+                    candidates=candidates,
+                    llm_config=llm_config,
+                    contrast_config=contrast_config,
+                    repo_path=repo_path,
+                    jar_path=jar_path,
+                    already_matched=already_matched,
+                    toolsets=toolsets,
+                )
+            except Exception as e:
+                elapsed = time.monotonic() - t0
+                log.error("LLM agent failed for %s (%.1fs): %s", module.name, elapsed, type(e).__name__)
+                log.debug("LLM agent exception detail for %s: %s", module.name, e, exc_info=True)
+                return None
+
+    async with AsyncExitStack() as stack:
+        try:
+            for toolset in toolsets:
+                await stack.enter_async_context(toolset)
+        except Exception as e:
+            log.error("Failed to start MCP servers for LLM fallback: %s", type(e).__name__)
+            log.debug("MCP startup exception detail: %s", e, exc_info=True)
+            return dict.fromkeys((m.path for m in modules), None)
+
+        matches = await asyncio.gather(*(_bounded(m) for m in modules))
+    return {module.path: match for module, match in zip(modules, matches)}
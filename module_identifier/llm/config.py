@@ -1,16 +1,34 @@
 """LLM provider configuration loaded from environment variables."""
 
+import os
+import re
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
-from dotenv import dotenv_values
-
 VALID_PROVIDERS = ("contrast", "bedrock", "anthropic", "gemini")
 
 DEFAULT_CONTRAST_MODEL = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
 
+# "provider/model": splits on the first "/" and strips both halves in one pass
+_AGENT_MODEL_RE = re.compile(r"\s*([^/]*?)\s*/\s*(.*?)\s*\Z", re.DOTALL)
+
+# LLMConfig credential fields and the .env keys they are read from
+_CREDENTIAL_ENV = {
+    "aws_region_name": "AWS_REGION_NAME",
+    "aws_access_key_id": "AWS_ACCESS_KEY_ID",
+    "aws_secret_access_key": "AWS_SECRET_ACCESS_KEY",
+    "aws_session_token": "AWS_SESSION_TOKEN",
+    "aws_bearer_token_bedrock": "AWS_BEARER_TOKEN_BEDROCK",
+    "anthropic_api_key": "ANTHROPIC_API_KEY",
+    "gemini_api_key": "GEMINI_API_KEY",
+}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """Configuration for the LLM fallback agent.
 
@@ -62,7 +80,7 @@ class LLMConfig:
         is read — shell env vars are deliberately ignored to prevent credential
         leakage from the host environment.
         """
-        env = dotenv_values()
+        env = _dotenv_env()
 
         agent_model = env.get("AGENT_MODEL", "")
         if not agent_model:
@@ -71,68 +89,120 @@ class LLMConfig:
         else:
             provider, model_name = _parse_agent_model(agent_model)
 
-        config = cls(
+        credentials = dict(zip(_CREDENTIAL_ENV, map(env.get, _CREDENTIAL_ENV.values())))
+        return _validated_config(
+            cls,
             provider=provider,
             model_name=model_name,
-            aws_region_name=env.get("AWS_REGION_NAME"),
-            aws_access_key_id=env.get("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=env.get("AWS_SECRET_ACCESS_KEY"),
-            aws_session_token=env.get("AWS_SESSION_TOKEN"),
-            aws_bearer_token_bedrock=env.get("AWS_BEARER_TOKEN_BEDROCK"),
-            anthropic_api_key=env.get("ANTHROPIC_API_KEY"),
-            gemini_api_key=env.get("GEMINI_API_KEY"),
             debug=env.get("DEBUG_LOGGING", "false").lower() == "true",
+            **credentials,
         )
-        return config
 
     def _validate(self) -> None:
         """Validate that required credentials exist for the selected provider."""
         if not self.model_name:
             raise ValueError("model_name is required")
-        if self.provider == "contrast":
-            # Auth comes from ContrastConfig, not LLMConfig — nothing to validate here
-            return
-        elif self.provider == "bedrock":
-            # Region is always required regardless of auth method
-            if not self.aws_region_name:
-                raise ValueError("Bedrock requires: AWS_REGION_NAME")
-            # Need either bearer token OR IAM keys
-            if not self.aws_bearer_token_bedrock:
-                iam_missing = [
-                    v for v in ("aws_access_key_id", "aws_secret_access_key")
-                    if not getattr(self, v)
-                ]
-                if iam_missing:
-                    raise ValueError(
-                        f"Bedrock requires: {', '.join(v.upper() for v in iam_missing)}"
-                    )
-        elif self.provider == "anthropic":
-            if not self.anthropic_api_key:
-                raise ValueError("Anthropic requires: ANTHROPIC_API_KEY")
-        elif self.provider == "gemini":
-            if not self.gemini_api_key:
-                raise ValueError("Gemini requires: GEMINI_API_KEY")
-        else:
+        _VALIDATORS.get(self.provider, _validate_unknown)(self)
+
+
+@lru_cache(maxsize=2)
+def _validated_config(cls: type[LLMConfig], **fields) -> LLMConfig:
+    """Construct (and so validate) a config once per distinct set of field values.
+
+    Safe to share because LLMConfig is frozen. Failed validation raises and
+    is not cached.
+    """
+    return cls(**fields)
+
+
+# -- Per-provider credential checks, dispatched on LLMConfig.provider --
+
+
+def _validate_contrast(config: LLMConfig) -> None:
+    # Auth comes from ContrastConfig, not LLMConfig — nothing to validate here
+    pass
+
+
+def _validate_bedrock(config: LLMConfig) -> None:
+    # Region is always required regardless of auth method
+    if not config.aws_region_name:
+        raise ValueError("Bedrock requires: AWS_REGION_NAME")
+    # Need either bearer token OR IAM keys
+    if not config.aws_bearer_token_bedrock:
+        iam_missing = [
+            v for v in ("aws_access_key_id", "aws_secret_access_key")
+            if not getattr(config, v)
+        ]
+        if iam_missing:
             raise ValueError(
-                f"Unknown provider: {self.provider}. "
-                f"Valid options: {', '.join(VALID_PROVIDERS)}"
+                f"Bedrock requires: {', '.join(v.upper() for v in iam_missing)}"
             )
 
 
+def _validate_anthropic(config: LLMConfig) -> None:
+    if not config.anthropic_api_key:
+        raise ValueError("Anthropic requires: ANTHROPIC_API_KEY")
+
+
+def _validate_gemini(config: LLMConfig) -> None:
+    if not config.gemini_api_key:
+        raise ValueError("Gemini requires: GEMINI_API_KEY")
+
+
+def _validate_unknown(config: LLMConfig) -> None:
+    raise ValueError(
+        f"Unknown provider: {config.provider}. "
+        f"Valid options: {', '.join(VALID_PROVIDERS)}"
+    )
+
+
+_VALIDATORS = {
+    "contrast": _validate_contrast,
+    "bedrock": _validate_bedrock,
+    "anthropic": _validate_anthropic,
+    "gemini": _validate_gemini,
+}
+
+
+def _dotenv_env() -> Mapping[str, Optional[str]]:
+    """Parsed .env values, re-read only when the file changes.
+
+    Cached on (path, mtime, size) so repeated from_env() calls in one process
+    don't re-parse the file. The mapping is read-only because it is shared.
+    """
+    # Imported here so constructing LLMConfig directly never loads python-dotenv
+    from dotenv import find_dotenv
+
+    path = find_dotenv()
+    if not path:
+        return MappingProxyType({})
+    st = os.stat(path)
+    return _read_dotenv(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _read_dotenv(path: str, mtime_ns: int, size: int) -> Mapping[str, Optional[str]]:
+    from dotenv import dotenv_values
+
+    return MappingProxyType(dotenv_values(path))
+
+
 def _parse_agent_model(agent_model: str) -> tuple[str, str]:
     """Parse 'provider/model-name' into (provider, model_name).
 
     Raises ValueError if format is invalid or provider is unknown.
     """
-    if "/" not in agent_model:
+    m = _AGENT_MODEL_RE.match(agent_model)
+    if not m:
         raise ValueError(
             f"AGENT_MODEL must use provider/model format, got: {agent_model!r}. "
             f"Valid providers: {', '.join(VALID_PROVIDERS)}"
         )
 
-    provider, _, model_name = agent_model.partition("/")
-    provider = provider.strip().lower()
-    model_name = model_name.strip()
+    # Interned so membership and _VALIDATORS lookups hit the identity fast path
+    # against the (compile-time interned) provider literals
+    provider = sys.intern(m[1].lower())
+    model_name = m[2]
 
     if provider not in VALID_PROVIDERS:
         raise ValueError(
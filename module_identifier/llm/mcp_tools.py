@@ -7,11 +7,10 @@ Provides two MCP servers:
 Tool filtering reduces token usage by ~70% (see app-identifier research).
 """
 
-import os
 from typing import List
 
 from ..config import ContrastConfig
-from ..mcp_contrast import _default_jar_path
+from ..mcp_contrast import _DOCKER_ARGS, _default_jar_path, _jar_exists
 
 
 # Filtered tool sets — only tools the agent actually needs.
@@ -27,6 +26,25 @@ CONTRAST_TOOLS = frozenset({
     "contrast__search_applications",
 })
 
+# Filesystem server invocation; the repo path is appended per call.
+_FS_ARGS_PREFIX = (
+    "-y",
+    "--registry", "https://registry.npmjs.org",
+    "--cache", "/tmp/.npm-cache",
+    "--prefer-offline",
+    "@modelcontextprotocol/server-filesystem@2025.11.25",
+)
+
+
+# .filtered() predicates, called once per tool listing. Module-level functions
+# rather than per-call lambdas, so they're created once.
+def _is_filesystem_tool(ctx, tool_def, /) -> bool:
+    return tool_def.name in FILESYSTEM_TOOLS
+
+
+def _is_contrast_tool(ctx, tool_def, /) -> bool:
+    return tool_def.name in CONTRAST_TOOLS
+
 
 async def create_mcp_toolsets(
     contrast_config: ContrastConfig,
@@ -54,29 +72,19 @@ async def create_mcp_toolsets(
     # See: .docs/smartfix_integration.md "Supply Chain" section.
     fs_server = MCPServerStdio(
         command="npx",
-        args=[
-            "-y",
-            "--registry", "https://registry.npmjs.org",
-            "--cache", "/tmp/.npm-cache",
-            "--prefer-offline",
-            "@modelcontextprotocol/server-filesystem@2025.11.25",
-            repo_path,
-        ],
+        args=[*_FS_ARGS_PREFIX, repo_path],
         cwd=repo_path,
         tool_prefix="fs_",
         timeout=30,
     )
-    fs_filtered = fs_server.filtered(
-        lambda ctx, tool_def: tool_def.name in FILESYSTEM_TOOLS
-    )
+    fs_filtered = fs_server.filtered(_is_filesystem_tool)
     toolsets.append(fs_filtered)
 
     # Contrast MCP — search only
-    env = contrast_config.as_env()
-    env["PATH"] = os.environ.get("PATH", "")
+    env = contrast_config.subprocess_env()
 
     jar = jar_path or _default_jar_path()
-    if os.path.isfile(jar):
+    if _jar_exists(jar):
         contrast_server = MCPServerStdio(
             command="java",
             args=["-jar", jar, "-t", "stdio"],
@@ -87,24 +95,13 @@ async def create_mcp_toolsets(
     else:
         contrast_server = MCPServerStdio(
             command="docker",
-            args=[
-                "run", "-i", "--rm",
-                "-e", "CONTRAST_HOST_NAME",
-                "-e", "CONTRAST_API_KEY",
-                "-e", "CONTRAST_SERVICE_KEY",
-                "-e", "CONTRAST_USERNAME",
-                "-e", "CONTRAST_ORG_ID",
-                "contrast/mcp-contrast:latest",
-                "-t", "stdio",
-            ],
+            args=list(_DOCKER_ARGS),
             env=env,
             tool_prefix="contrast_",
             timeout=30,
         )
 
-    contrast_filtered = contrast_server.filtered(
-        lambda ctx, tool_def: tool_def.name in CONTRAST_TOOLS
-    )
+    contrast_filtered = contrast_server.filtered(_is_contrast_tool)
     toolsets.append(contrast_filtered)
 
     return toolsets
@@ -1,6 +1,6 @@
 """Output models for LLM fallback agent."""
 
-from typing import Literal, Optional
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
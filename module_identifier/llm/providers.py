@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pydantic_ai.models import Model
@@ -16,12 +18,31 @@ def get_model(config: LLMConfig, contrast_config: ContrastConfig | None = None)
     """Create an LLM model instance for the configured provider.
 
     Uses lazy imports so provider-specific packages are only required
-    when that provider is selected.
+    when that provider is selected. Models are cached per (config,
+    contrast_config, running event loop), so every agent run in a batch
+    shares one provider client and its connection pool. The loop is part
+    of the key because async HTTP clients can't be reused across loops.
 
     Args:
         config: LLM configuration (provider, model name, credentials).
         contrast_config: Contrast credentials, required when provider is "contrast".
     """
+    return _cached_model(config, contrast_config, _running_loop())
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _cached_model(
+    config: LLMConfig,
+    contrast_config: ContrastConfig | None,
+    loop: asyncio.AbstractEventLoop | None,
+) -> Model:
     provider = config.provider
 
     if provider == "contrast":
@@ -48,15 +69,12 @@ def _create_bedrock_model(config: LLMConfig) -> Model:
             region_name=config.aws_region_name,
         )
     else:
-        import boto3
-
-        session = boto3.Session(
-            aws_access_key_id=config.aws_access_key_id,
-            aws_secret_access_key=config.aws_secret_access_key,
-            aws_session_token=config.aws_session_token,
-            region_name=config.aws_region_name,
+        client = _bedrock_client(
+            config.aws_access_key_id,
+            config.aws_secret_access_key,
+            config.aws_session_token,
+            config.aws_region_name,
         )
-        client = session.client("bedrock-runtime")
         provider = BedrockProvider(bedrock_client=client)
 
     return BedrockConverseModel(
@@ -65,6 +83,40 @@ def _create_bedrock_model(config: LLMConfig) -> Model:
     )
 
 
+@lru_cache(maxsize=1)
+def _bedrock_client(
+    aws_access_key_id: str | None,
+    aws_secret_access_key: str | None,
+    aws_session_token: str | None,
+    region_name: str | None,
+):
+    """Build (once per credential set) a bedrock-runtime client from explicit IAM keys.
+
+    An explicit boto3 Session, rather than BedrockProvider's own credential
+    kwargs, so AWS_* variables in the host shell never take precedence over
+    the .env values. botocore clients are thread-safe and not tied to an
+    event loop, so one client (and its connection pool) serves every run.
+    """
+    import boto3
+    from botocore.config import Config
+
+    session = boto3.Session(
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        aws_session_token=aws_session_token,
+        region_name=region_name,
+    )
+    # Timeouts match BedrockProvider's own defaults; keepalive keeps pooled
+    # connections warm between the agent's LLM calls.
+    config = Config(
+        read_timeout=300,
+        connect_timeout=60,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 3},
+    )
+    return session.client("bedrock-runtime", config=config)
+
+
 def _create_anthropic_model(config: LLMConfig) -> Model:
     from pydantic_ai.models.anthropic import AnthropicModel
     from pydantic_ai.providers.anthropic import AnthropicProvider
@@ -86,26 +138,30 @@ def _create_gemini_model(config: LLMConfig) -> Model:
 
 
 def _create_contrast_model(config: LLMConfig, contrast_config: ContrastConfig) -> Model:
-    import base64
-
-    from anthropic import AsyncAnthropic
     from pydantic_ai.models.anthropic import AnthropicModel
     from pydantic_ai.providers.anthropic import AnthropicProvider
 
-    auth_token = base64.b64encode(
-        f"{contrast_config.username}:{contrast_config.service_key}".encode()
-    ).decode()
+    client = _contrast_client(contrast_config, _running_loop())
+    provider = AnthropicProvider(anthropic_client=client)
+    return AnthropicModel(model_name=config.model_name, provider=provider)
+
 
-    host = contrast_config.host_name.rstrip("/")
-    base_url = f"https://{host}/api/llm-proxy/v2/organizations/{contrast_config.org_id}/anthropic"
+@lru_cache(maxsize=4)
+def _contrast_client(contrast_config: ContrastConfig, loop: asyncio.AbstractEventLoop | None):
+    """One LLM-proxy client per Contrast account and event loop.
 
-    client = AsyncAnthropic(
+    Keyed independently of LLMConfig so models that differ only in
+    model_name or debug share a connection pool. The loop stays in the key
+    because the underlying httpx.AsyncClient is bound to the loop it first
+    runs on.
+    """
+    from anthropic import AsyncAnthropic
+
+    return AsyncAnthropic(
         api_key=contrast_config.api_key,
-        base_url=base_url,
+        base_url=contrast_config.llm_proxy_url,
         default_headers={
             "API-Key": contrast_config.api_key,
-            "Authorization": auth_token,
+            "Authorization": contrast_config.basic_auth_header,
         },
     )
-    provider = AnthropicProvider(anthropic_client=client)
-    return AnthropicModel(model_name=config.model_name, provider=provider)
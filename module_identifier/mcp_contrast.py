@@ -5,10 +5,12 @@ exposes a simple search function that returns AppCandidates
 compatible with the resolver's SearchFn type.
 """
 
-import json
+import asyncio
 import logging
 import os
+import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 
 from mcp import ClientSession
@@ -17,15 +19,48 @@ from mcp.client.stdio import StdioServerParameters, stdio_client
 from .config import ContrastConfig
 from .resolver import AppCandidate
 
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    from json import loads as _json_loads
+
 log = logging.getLogger(__name__)
 
+PAGE_SIZE = 100  # MCP server max
+# Pages requested concurrently once the org is known to span more than one
+PAGE_FETCH_BATCH = 4
+
+
+# Docker fallback invocation; credentials are passed through from the env by name.
+_DOCKER_ARGS = (
+    "run", "-i", "--rm",
+    "-e", "CONTRAST_HOST_NAME",
+    "-e", "CONTRAST_API_KEY",
+    "-e", "CONTRAST_SERVICE_KEY",
+    "-e", "CONTRAST_USERNAME",
+    "-e", "CONTRAST_ORG_ID",
+    "contrast/mcp-contrast:latest",
+    "-t", "stdio",
+)
+
 
 def _default_jar_path() -> str:
     """Read jar path from env (set by load_dotenv at runtime)."""
-    raw = os.environ.get("MCP_CONTRAST_JAR_PATH", "")
+    return _resolve_jar_path(os.environ.get("MCP_CONTRAST_JAR_PATH", ""))
+
+
+# The env var is re-read on every call, but resolving it and stat'ing the jar
+# happen once per distinct path per process.
+@lru_cache(maxsize=4)
+def _resolve_jar_path(raw: str) -> str:
     return str(Path(os.path.expanduser(raw)).resolve()) if raw else ""
 
 
+@lru_cache(maxsize=8)
+def _jar_exists(jar: str) -> bool:
+    return os.path.isfile(jar)
+
+
 def _server_params(
     config: ContrastConfig,
     jar_path: str | None = None,
@@ -35,11 +70,10 @@ def _server_params(
     Prefers running the jar directly (faster, no Docker overhead).
     Falls back to Docker if no jar_path provided and default doesn't exist.
     """
-    env = config.as_env()
-    env["PATH"] = os.environ.get("PATH", "")
+    env = config.subprocess_env()
 
     jar = jar_path or _default_jar_path()
-    if os.path.isfile(jar):
+    if _jar_exists(jar):
         return StdioServerParameters(
             command="java",
             args=["-jar", jar, "-t", "stdio"],
@@ -49,65 +83,76 @@ def _server_params(
     # Fallback: Docker
     return StdioServerParameters(
         command="docker",
-        args=[
-            "run", "-i", "--rm",
-            "-e", "CONTRAST_HOST_NAME",
-            "-e", "CONTRAST_API_KEY",
-            "-e", "CONTRAST_SERVICE_KEY",
-            "-e", "CONTRAST_USERNAME",
-            "-e", "CONTRAST_ORG_ID",
-            "contrast/mcp-contrast:latest",
-            "-t", "stdio",
-        ],
+        args=list(_DOCKER_ARGS),
         env=env,
     )
 
 
-def _parse_candidates(result) -> list[AppCandidate]:
-    """Parse MCP tool result into AppCandidates."""
-    candidates = []
+# Keys an application id may appear under, in priority order. mcp-contrast
+# itself uses "appID"; the rest cover other response shapes.
+_ID_KEYS = ("appID", "app_id", "application_id", "id")
+
+
+def _app_id(app: dict):
+    """First present id in _ID_KEYS. Only None and "" count as missing, so a numeric 0 is kept."""
+    for key in _ID_KEYS:
+        value = app.get(key)
+        if value is not None and value != "":
+            return value
+    return None
+
+
+def _parse_page(result) -> tuple[list[AppCandidate], bool, int]:
+    """Parse one MCP tool result in a single pass over its text blocks.
+
+    Returns (candidates, has_more_pages, raw_text_length). Each block is
+    decoded once; hasMorePages is taken from the first JSON object block.
+    """
+    candidates: list[AppCandidate] = []
+    has_more: bool | None = None
+    raw_bytes = 0
     for block in result.content:
         if block.type != "text":
             continue
+        raw_bytes += len(block.text)
         try:
-            data = json.loads(block.text)
-        except (json.JSONDecodeError, TypeError):
+            data = _json_loads(block.text)
+        # JSONDecodeError (stdlib and orjson) is a ValueError
+        except (ValueError, TypeError):
             continue
 
         # Handle list, {"items": [...]}, or single app responses
         if isinstance(data, list):
             apps = data
-        elif isinstance(data, dict) and isinstance(data.get("items"), list):
-            apps = data["items"]
+        elif isinstance(data, dict):
+            if has_more is None:
+                has_more = bool(data.get("hasMorePages", False))
+            apps = data["items"] if isinstance(data.get("items"), list) else [data]
         else:
             apps = [data]
         for app in apps:
             if not isinstance(app, dict):
                 continue
-            app_id = app.get("appID") or app.get("app_id") or app.get("application_id") or app.get("id")
+            app_id = app.get("appID")
+            if app_id is None or app_id == "":
+                app_id = _app_id(app)
             name = app.get("name") or app.get("application_name")
             language = app.get("language", "")
-            if app_id and name:
+            if isinstance(language, str):
+                # A handful of distinct values across the whole org: share one object each
+                language = sys.intern(language)
+            if app_id is not None and name:
                 candidates.append(AppCandidate(
                     app_id=str(app_id),
                     name=name,
                     language=language,
                 ))
-    return candidates
+    return candidates, bool(has_more), raw_bytes
 
 
-def _has_more_pages(result) -> bool:
-    """Check if the MCP paginated response indicates more pages."""
-    for block in result.content:
-        if block.type != "text":
-            continue
-        try:
-            data = json.loads(block.text)
-        except (json.JSONDecodeError, TypeError):
-            continue
-        if isinstance(data, dict):
-            return bool(data.get("hasMorePages", False))
-    return False
+def _parse_candidates(result) -> list[AppCandidate]:
+    """Parse MCP tool result into AppCandidates."""
+    return _parse_page(result)[0]
 
 
 class ContrastMCP:
@@ -153,37 +198,52 @@ class ContrastMCP:
             await self._stdio_cm.__aexit__(*exc)
 
     async def list_applications(self) -> list[AppCandidate]:
-        """Fetch all applications from the Contrast org, paginating if needed."""
+        """Fetch all applications from the Contrast org, paginating if needed.
+
+        Page 1 is fetched alone. If it reports more pages, the following
+        pages are requested PAGE_FETCH_BATCH at a time concurrently and
+        consumed in order, so a K-page org costs about 1 + K / batch round
+        trips instead of K. Pages past the last one are discarded, including
+        any that failed; only a failure at or before the last page is raised.
+        """
         assert self._session is not None, "Not connected — use 'async with'"
 
         all_candidates: list[AppCandidate] = []
         page = 1
-        page_size = 100  # MCP server max
+        batch = [await self._fetch_page(page)]
 
         while True:
-            t0 = time.monotonic()
-            result = await self._session.call_tool(
-                "search_applications",
-                {"page": page, "pageSize": page_size},
+            for fetched in batch:
+                if isinstance(fetched, BaseException):
+                    raise fetched
+                candidates, has_more = fetched
+                all_candidates.extend(candidates)
+                if not has_more or not candidates:
+                    self._total_candidates += len(all_candidates)
+                    return all_candidates
+            first = page + 1
+            page += PAGE_FETCH_BATCH
+            # Exceptions are returned, not raised: a page that turns out to be
+            # past the end may fail without affecting the result.
+            batch = await asyncio.gather(
+                *(self._fetch_page(p) for p in range(first, page + 1)),
+                return_exceptions=True,
             )
-            elapsed = time.monotonic() - t0
-
-            self._call_count += 1
-            self._total_time += elapsed
 
-            raw_bytes = sum(len(b.text) for b in result.content if b.type == "text")
-            candidates = _parse_candidates(result)
-            all_candidates.extend(candidates)
-
-            has_more = _has_more_pages(result)
-            log.info(
-                "list_applications page %d → %d apps, %d bytes, %.2fs (hasMore=%s)",
-                page, len(candidates), raw_bytes, elapsed, has_more,
-            )
+    async def _fetch_page(self, page: int) -> tuple[list[AppCandidate], bool]:
+        t0 = time.monotonic()
+        result = await self._session.call_tool(
+            "search_applications",
+            {"page": page, "pageSize": PAGE_SIZE},
+        )
+        elapsed = time.monotonic() - t0
 
-            if not has_more or not candidates:
-                break
-            page += 1
+        self._call_count += 1
+        self._total_time += elapsed
 
-        self._total_candidates += len(all_candidates)
-        return all_candidates
+        candidates, has_more, raw_bytes = _parse_page(result)
+        log.info(
+            "list_applications page %d → %d apps, %d bytes, %.2fs (hasMore=%s)",
+            page, len(candidates), raw_bytes, elapsed, has_more,
+        )
+        return candidates, has_more
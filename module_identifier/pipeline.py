@@ -5,19 +5,29 @@ Two-phase resolution:
   2. LLM agent — investigates unmatched modules with MCP tools
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 
+from .cache import cached_apps
 from .config import ContrastConfig
 from .discover import discover_modules
 from .llm import LLMConfig, llm_resolve_modules
+from .llm.agent import DEFAULT_MAX_CONCURRENCY
 from .mcp_contrast import ContrastMCP
 from .resolver import AppMatch, resolve_modules
 
 log = logging.getLogger(__name__)
 
+# JSON payload rows: output keys paired with a getter for the match attributes
+_DETERMINISTIC_KEYS = ("app_id", "app_name", "confidence", "search_term")
+_deterministic_row = attrgetter("app_id", "app_name", "confidence", "search_term")
+_LLM_KEYS = ("app_id", "app_name", "confidence", "reasoning")
+_llm_row = attrgetter("application_id", "application_name", "confidence", "reasoning")
+
 
 @dataclass
 class PipelineResult:
@@ -27,6 +37,26 @@ class PipelineResult:
     total: int
     llm_matched: dict[str, "LLMMatch"] = field(default_factory=dict)  # module path → LLM match
 
+    def as_payload(self) -> dict:
+        """Return the result as JSON-ready primitives (the CLI's module-level output).
+
+        The unmatched list is shared with this result, not copied.
+        """
+        deterministic = {
+            path: dict(zip(_DETERMINISTIC_KEYS, _deterministic_row(match)))
+            for path, match in self.matched.items()
+        }
+        llm = {
+            path: dict(zip(_LLM_KEYS, _llm_row(match)))
+            for path, match in self.llm_matched.items()
+        }
+        return {
+            "total_modules": self.total,
+            "deterministic_matched": deterministic,
+            "llm_matched": llm,
+            "unmatched": self.unmatched,
+        }
+
 
 async def run(
     repo_path: str | Path,
@@ -35,6 +65,9 @@ async def run(
     confidence_threshold: float = 0.5,
     depth: int = 4,
     jar_path: str | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    mcp: ContrastMCP | None = None,
+    app_cache_ttl: float | None = None,
 ) -> PipelineResult:
     """Discover modules in a repo and resolve them to Contrast app IDs.
 
@@ -45,18 +78,40 @@ async def run(
         confidence_threshold: Minimum score for deterministic matching.
         depth: Max directory depth for module discovery.
         jar_path: Optional path to mcp-contrast jar.
+        max_concurrency: Max LLM agent runs in flight during the fallback phase.
+        mcp: Already-open ContrastMCP session to reuse across calls.
+        app_cache_ttl: Reuse an on-disk org app list younger than this many
+            seconds instead of fetching it. None (default) always fetches.
 
     Returns a PipelineResult with matched/unmatched/llm_matched modules.
     """
     t0 = time.monotonic()
 
-    modules = discover_modules(Path(repo_path), depth=depth)
-    log.info("Discovered %d modules in %s", len(modules), repo_path)
-    for m in modules:
-        log.info("  %s (%s) @ %s", m.name, m.ecosystem.value, m.path)
-
-    async with ContrastMCP(config, jar_path=jar_path) as mcp:
-        apps = await mcp.list_applications()
+    async def fetch_apps():
+        if mcp is not None:
+            return await mcp.list_applications()
+        async with ContrastMCP(config, jar_path=jar_path) as session:
+            return await session.list_applications()
+
+    # The filesystem walk runs in a worker thread so it overlaps MCP server
+    # startup and the app list fetch instead of blocking the event loop.
+    # If discovery fails, the fetch is cancelled (stopping the server)
+    # before the error propagates.
+    fetch = asyncio.ensure_future(cached_apps(config, app_cache_ttl, fetch_apps))
+    try:
+        modules = await asyncio.to_thread(discover_modules, Path(repo_path), depth=depth)
+    except BaseException:
+        fetch.cancel()
+        await asyncio.gather(fetch, return_exceptions=True)
+        raise
+    apps = await fetch
+    # Per-item detail lines are joined into one record per block, and only
+    # built when INFO is enabled.
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Discovered %d modules in %s%s", len(modules), repo_path,
+            "".join(f"\n  {m.name} ({m.ecosystem.value}) @ {m.path}" for m in modules),
+        )
 
     # Phase 1: Deterministic scoring
     results = resolve_modules(modules, apps, confidence_threshold)
@@ -65,12 +120,16 @@ async def run(
     unmatched_paths = [path for path, match in results.items() if match is None]
 
     elapsed_det = time.monotonic() - t0
-    log.info("--- Deterministic phase (%.1fs) ---", elapsed_det)
-    log.info("  %d/%d matched, %d unmatched", len(matched), len(modules), len(unmatched_paths))
-    for path, match in matched.items():
-        log.info("  ✓ %s → %s (%.0f%%)", path, match.app_name, match.confidence * 100)
-    for path in unmatched_paths:
-        log.info("  ✗ %s → no match", path)
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "--- Deterministic phase (%.1fs) ---\n  %d/%d matched, %d unmatched%s%s",
+            elapsed_det, len(matched), len(modules), len(unmatched_paths),
+            "".join(
+                f"\n  ✓ {path} → {match.app_name} ({match.confidence * 100:.0f}%)"
+                for path, match in matched.items()
+            ),
+            "".join(f"\n  ✗ {path} → no match" for path in unmatched_paths),
+        )
 
     # Phase 2: LLM agent for unmatched modules
     llm_matched = {}
@@ -86,16 +145,22 @@ async def run(
             repo_path=str(repo_path),
             jar_path=jar_path,
             already_matched=matched,
+            max_concurrency=max_concurrency,
         )
 
         llm_matched = {path: m for path, m in llm_results.items() if m is not None}
         still_unmatched = [path for path, m in llm_results.items() if m is None]
 
         elapsed_llm = time.monotonic() - t0 - elapsed_det
-        log.info("--- LLM phase (%.1fs) ---", elapsed_llm)
-        log.info("  %d/%d resolved by LLM", len(llm_matched), len(unmatched_modules))
-        for path, m in llm_matched.items():
-            log.info("  ✓ %s → %s (%s)", path, m.application_name, m.confidence)
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "--- LLM phase (%.1fs) ---\n  %d/%d resolved by LLM%s",
+                elapsed_llm, len(llm_matched), len(unmatched_modules),
+                "".join(
+                    f"\n  ✓ {path} → {m.application_name} ({m.confidence})"
+                    for path, m in llm_matched.items()
+                ),
+            )
 
         unmatched_paths = still_unmatched
 
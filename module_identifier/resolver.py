@@ -4,13 +4,15 @@ Flow: extract search term → search Contrast → score candidates → pick best
 """
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from .models import DiscoveredModule, Ecosystem
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppCandidate:
     """An application returned from Contrast search."""
     app_id: str
@@ -18,7 +20,7 @@ class AppCandidate:
     language: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AppMatch:
     """A resolved match between a discovered module and a Contrast application."""
     module: DiscoveredModule
@@ -45,13 +47,19 @@ def extract_search_term(module: DiscoveredModule) -> str:
       - PHP:    "vendor/package"              → "package"
       - Others: returned as-is
     """
-    if module.contrast_app_name:
-        return module.contrast_app_name
+    return _search_term(module.name, module.ecosystem, module.contrast_app_name)
+
 
-    name = module.name
+# Keyed on the fields the term depends on (DiscoveredModule itself is an
+# unhashable pydantic model). identify and the LLM fallback ask for the same
+# module's term several times per run.
+@lru_cache(maxsize=1024)
+def _search_term(name: str, ecosystem: Ecosystem, contrast_app_name: Optional[str]) -> str:
+    if contrast_app_name:
+        return contrast_app_name
 
     # Maven — groupId:artifactId → artifactId
-    if ":" in name and module.ecosystem == Ecosystem.JAVA:
+    if ":" in name and ecosystem == Ecosystem.JAVA:
         return name.split(":")[-1]
 
     # Node scoped — @scope/name → name
@@ -59,11 +67,11 @@ def extract_search_term(module: DiscoveredModule) -> str:
         return name.split("/", 1)[-1]
 
     # Go module path — github.com/org/repo → repo
-    if "/" in name and module.ecosystem == Ecosystem.GO:
+    if "/" in name and ecosystem == Ecosystem.GO:
         return name.rsplit("/", 1)[-1]
 
     # PHP — vendor/package → package
-    if "/" in name and module.ecosystem == Ecosystem.PHP:
+    if "/" in name and ecosystem == Ecosystem.PHP:
         return name.rsplit("/", 1)[-1]
 
     return name
@@ -71,20 +79,32 @@ def extract_search_term(module: DiscoveredModule) -> str:
 
 # -- Candidate scoring --
 
+# Interned, like AppCandidate.language from the MCP parser, so the language
+# comparison in scoring usually succeeds on identity.
 _ECOSYSTEM_TO_LANGUAGE: dict[Ecosystem, str] = {
-    Ecosystem.JAVA: "Java",
-    Ecosystem.NODE: "Node",
-    Ecosystem.PYTHON: "Python",
-    Ecosystem.GO: "Go",
-    Ecosystem.RUBY: "Ruby",
-    Ecosystem.DOTNET: ".NET Core",
-    Ecosystem.PHP: "PHP",
+    ecosystem: sys.intern(language)
+    for ecosystem, language in {
+        Ecosystem.JAVA: "Java",
+        Ecosystem.NODE: "Node",
+        Ecosystem.PYTHON: "Python",
+        Ecosystem.GO: "Go",
+        Ecosystem.RUBY: "Ruby",
+        Ecosystem.DOTNET: ".NET Core",
+        Ecosystem.PHP: "PHP",
+    }.items()
 }
 
 
-def _tokenize(name: str) -> set[str]:
+_LANGUAGE_BONUS = 0.2
+
+_TOKEN_SPLIT = re.compile(r"[-_.\s]+").split
+
+
+# Not memoized: a process-wide cache would keep every app name ever scored.
+# resolve_modules tokenizes each app name once per run via _pack_candidates.
+def _tokenize(name: str) -> frozenset[str]:
     """Split a name into lowercase tokens on common separators."""
-    return set(re.split(r"[-_.\s]+", name.lower())) - {""}
+    return frozenset(t for t in _TOKEN_SPLIT(name.lower()) if t)
 
 
 def score_candidate(
@@ -101,31 +121,60 @@ def score_candidate(
 
     Max score is 1.0 (exact name + correct language).
     """
-    app_name_lower = candidate.name.lower()
+    return candidate_scorer(module, search_term)(candidate)
+
+
+def candidate_scorer(
+    module: DiscoveredModule,
+    search_term: str,
+) -> Callable[[AppCandidate], float]:
+    """Return score_candidate bound to one module and search term.
+
+    The module-side work (lowercasing, tokenizing, language lookup) is done
+    once here instead of once per candidate, which matters when a module
+    is scored against every app in the org.
+    """
     term_lower = search_term.lower()
     expected_lang = _ECOSYSTEM_TO_LANGUAGE.get(module.ecosystem)
-    lang_match = expected_lang and candidate.language == expected_lang
+    module_tokens = _tokenize(search_term)
+
+    def score(candidate: AppCandidate) -> float:
+        app_tokens = _tokenize(candidate.name)
+        return _score(
+            term_lower, expected_lang, candidate.name.lower(), candidate.language,
+            len(module_tokens & app_tokens), len(module_tokens), len(app_tokens),
+        )
+
+    return score
+
+
+def _score(
+    term_lower: str,
+    expected_lang: Optional[str],
+    name_lower: str,
+    language: str,
+    shared: int,
+    module_size: int,
+    app_size: int,
+) -> float:
+    """Score from precomputed pieces; shared is the module/app token intersection size."""
+    lang_match = expected_lang and language == expected_lang
 
     # Exact name match
-    if app_name_lower == term_lower:
+    if name_lower == term_lower:
         return 1.0 if lang_match else 0.8
 
     # Token-based similarity (Jaccard)
-    module_tokens = _tokenize(search_term)
-    app_tokens = _tokenize(candidate.name)
-
-    if not module_tokens or not app_tokens:
+    if not module_size or not app_size:
         return 0.0
 
-    intersection = module_tokens & app_tokens
-    union = module_tokens | app_tokens
-    jaccard = len(intersection) / len(union)
+    jaccard = shared / (module_size + app_size - shared)
 
     score = jaccard * 0.7
 
     # Language alignment bonus
     if lang_match:
-        score += 0.2
+        score += _LANGUAGE_BONUS
 
     return min(score, 1.0)
 
@@ -133,6 +182,63 @@ def score_candidate(
 # -- Resolver --
 
 
+@dataclass
+class _CandidatePack:
+    """Candidates in struct-of-arrays form, with per-name work done up front.
+
+    Parallel lists indexed by position in the original candidate list, plus
+    positions by lowercased name and by name token for shortlisting. Token
+    sets are also kept as int bitmaps over a shared vocabulary, so an
+    intersection size is one AND plus a popcount instead of a set build.
+    """
+    lowers: list[str]
+    masks: list[int]
+    sizes: list[int]
+    languages: list[str]
+    by_name: dict[str, list[int]]
+    by_token: dict[str, list[int]]
+    vocab: dict[str, int]
+
+    def mask(self, tokens: frozenset[str]) -> int:
+        """Bitmap of tokens; tokens outside the vocabulary can't be shared, so they're dropped."""
+        vocab = self.vocab
+        return sum(1 << vocab[t] for t in tokens if t in vocab)
+
+
+def _pack_candidates(candidates: list[AppCandidate]) -> _CandidatePack:
+    pack = _CandidatePack(
+        lowers=[c.name.lower() for c in candidates],
+        masks=[],
+        sizes=[],
+        languages=[c.language for c in candidates],
+        by_name={},
+        by_token={},
+        vocab={},
+    )
+    vocab = pack.vocab
+    for i, (lower, candidate) in enumerate(zip(pack.lowers, candidates)):
+        pack.by_name.setdefault(lower, []).append(i)
+        tokens = _tokenize(candidate.name)
+        mask = 0
+        for token in tokens:
+            pack.by_token.setdefault(token, []).append(i)
+            mask |= 1 << vocab.setdefault(token, len(vocab))
+        pack.masks.append(mask)
+        pack.sizes.append(len(tokens))
+    return pack
+
+
+def _shortlist(term_lower: str, module_tokens: frozenset[str], pack: _CandidatePack) -> list[int]:
+    """Positions that exactly match or share a token with the term, in list order.
+
+    Every other candidate scores at most _LANGUAGE_BONUS.
+    """
+    positions = set(pack.by_name.get(term_lower, ()))
+    for token in module_tokens:
+        positions.update(pack.by_token.get(token, ()))
+    return sorted(positions)
+
+
 def resolve_module(
     module: DiscoveredModule,
     candidates: list[AppCandidate],
@@ -143,23 +249,52 @@ def resolve_module(
     Scores the module against a pre-fetched list of all org apps.
     Returns None if no candidate meets the confidence threshold.
     """
+    return _resolve_module(module, candidates, confidence_threshold, _pack_candidates(candidates))
+
+
+def _resolve_module(
+    module: DiscoveredModule,
+    candidates: list[AppCandidate],
+    confidence_threshold: float,
+    pack: _CandidatePack,
+) -> Optional[AppMatch]:
     search_term = extract_search_term(module)
 
     if not candidates:
         return None
 
-    best_candidate = None
+    term_lower = search_term.lower()
+    expected_lang = _ECOSYSTEM_TO_LANGUAGE.get(module.ecosystem)
+    module_tokens = _tokenize(search_term)
+    module_mask = pack.mask(module_tokens)
+    module_size = len(module_tokens)
+
+    # Candidates with no exact or token match can't reach a threshold above
+    # the language bonus, so only the shortlist needs scoring.
+    if confidence_threshold > _LANGUAGE_BONUS:
+        positions = _shortlist(term_lower, module_tokens, pack)
+    else:
+        positions = range(len(candidates))
+
+    lowers, masks, sizes, languages = pack.lowers, pack.masks, pack.sizes, pack.languages
+    best = -1
     best_score = 0.0
 
-    for candidate in candidates:
-        score = score_candidate(module, candidate, search_term)
+    for i in positions:
+        score = _score(
+            term_lower, expected_lang, lowers[i], languages[i],
+            (module_mask & masks[i]).bit_count(), module_size, sizes[i],
+        )
         if score > best_score:
             best_score = score
-            best_candidate = candidate
+            best = i
+            if score >= 1.0:
+                break  # exact name + language; nothing later can win a tie
 
-    if best_candidate is None or best_score < confidence_threshold:
+    if best < 0 or best_score < confidence_threshold:
         return None
 
+    best_candidate = candidates[best]
     return AppMatch(
         module=module,
         app_id=best_candidate.app_id,
@@ -176,10 +311,12 @@ def resolve_modules(
 ) -> dict[str, Optional[AppMatch]]:
     """Resolve a list of discovered modules to Contrast app IDs.
 
-    Scores each module against the same pre-fetched candidate list.
-    Returns {module.path: AppMatch or None} for every module.
+    Scores each module against the same pre-fetched candidate list, packed
+    and indexed once by name and token so each module only scores
+    candidates it could match. Returns {module.path: AppMatch or None} for every module.
     """
+    pack = _pack_candidates(candidates)
     return {
-        module.path: resolve_module(module, candidates, confidence_threshold)
+        module.path: _resolve_module(module, candidates, confidence_threshold, pack)
         for module in modules
     }
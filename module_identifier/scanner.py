@@ -1,12 +1,19 @@
-import json
+import os
 import re
 # stdlib ElementTree is not vulnerable to XXE (no external entity support)
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 
 from .models import DiscoveredModule, Ecosystem, Manifest
 
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    from json import loads as _json_loads
+
 
 SKIP_DIRS = {
     "node_modules", "vendor", "vendors", "bower_components",
@@ -54,11 +61,26 @@ _PRIMARY_MANIFESTS: list[Manifest] = [
     Manifest.COMPOSER_LOCK,
 ]
 
+# (manifest, filename, ecosystem) in priority order. Enum .value and the
+# ecosystem property are descriptor lookups; resolve them once.
+_PRIMARY_MANIFEST_TABLE: tuple[tuple[Manifest, str, Ecosystem], ...] = tuple(
+    (m, m.value, m.ecosystem) for m in _PRIMARY_MANIFESTS
+)
+_PRIMARY_MANIFEST_NAMES = frozenset(m.value for m in _PRIMARY_MANIFESTS)
+
+# Scanning is syscall-bound (listings, small manifest reads), which releases
+# the GIL, so more threads than cores still helps on slow filesystems.
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def discover_modules(repo_root: Path, depth: int = 4) -> list[DiscoveredModule]:
     """
     Recursively scan a repository for modules.
 
+    Directories are scanned one depth level at a time on a thread pool so
+    their listings and manifest reads overlap; results are returned in the
+    same depth-first, name-sorted order as a serial walk.
+
     Args:
         repo_root: Repository root directory.
         depth: Maximum directory depth to scan.
@@ -67,35 +89,82 @@ def discover_modules(repo_root: Path, depth: int = 4) -> list[DiscoveredModule]:
         List of discovered modules.
     """
     repo_root = repo_root.resolve()
+    scanned: dict[Path, tuple[list[DiscoveredModule], list[Path]]] = {}
+    # (st_dev, st_ino) of every directory queued, so a directory reachable
+    # through several symlinks or bind mounts is scanned once. Symlinks whose
+    # target the walk reaches by its real path are dropped in _scan_directory.
+    root_stat = repo_root.stat()
+    visited = {(root_stat.st_dev, root_stat.st_ino)}
+    level = [repo_root]
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        for remaining_depth in range(depth, -1, -1):
+            if not level:
+                break
+            descend = remaining_depth > 0
+            listings = pool.map(
+                _scan_directory, level, repeat(repo_root), repeat(descend), repeat(depth),
+            )
+            next_level: list[Path] = []
+            for dir_path, (modules, subdirs) in zip(level, listings):
+                children = []
+                for child, key in subdirs:
+                    if key not in visited:
+                        visited.add(key)
+                        children.append(child)
+                scanned[dir_path] = (modules, children)
+                next_level.extend(children)
+            level = next_level
+
     results: list[DiscoveredModule] = []
-    _scan_directory(repo_root, repo_root, depth, results)
+    stack = [repo_root] if depth >= 0 else []
+    while stack:
+        modules, subdirs = scanned[stack.pop()]
+        results.extend(modules)
+        stack.extend(reversed(subdirs))
     return results
 
 
 def _scan_directory(
     dir_path: Path,
     repo_root: Path,
-    remaining_depth: int,
-    results: list[DiscoveredModule],
-) -> None:
-    if remaining_depth < 0:
-        return
+    descend: bool,
+    depth: int,
+) -> tuple[list[DiscoveredModule], list[tuple[Path, tuple[int, int]]]]:
+    """Return the modules declared in dir_path and, if descend, its subdirectories to scan.
+
+    Each subdirectory comes with the (st_dev, st_ino) of the directory it resolves to.
+    """
+    # One directory listing serves both manifest detection and recursion.
+    # DirEntry.is_file()/is_dir() follow symlinks like Path.is_file()/is_dir(),
+    # and usually answer from the d_type returned by the listing itself.
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except PermissionError:
+        return [], []
+    files = {e.name for e in entries if _entry_is_file(e)}
 
     # Check for primary manifests, one per ecosystem
+    # Most directories have none, and the priority walk is skipped for them.
     found: dict[Ecosystem, Manifest] = {}
-    for manifest in _PRIMARY_MANIFESTS:
-        eco = manifest.ecosystem
-        if eco not in found and (dir_path / manifest.value).is_file():
-            found[eco] = manifest
+    present = _PRIMARY_MANIFEST_NAMES.intersection(files)
+    if present:
+        for manifest, filename, eco in _PRIMARY_MANIFEST_TABLE:
+            if eco not in found and filename in present:
+                found[eco] = manifest
 
     # Check for contrast_security.yaml in this directory
-    contrast_app_name = _contrast_app_name(dir_path)
+    contrast_app_name = _contrast_app_name(dir_path, files) if found else None
 
     # Build a DiscoveredModule for each ecosystem found in this directory
+    modules: list[DiscoveredModule] = []
+    if found:
+        # dir_path is always repo_root joined with entry names, so the
+        # relative path is a plain prefix strip
+        rel_path = str(dir_path)[len(os.path.join(repo_root, "")):] or "."
     for eco, manifest in found.items():
-        rel_path = str(dir_path.relative_to(repo_root)) if dir_path != repo_root else "."
         name = _extract_name(dir_path, manifest) or dir_path.name
-        results.append(DiscoveredModule(
+        modules.append(DiscoveredModule(
             name=name,
             path=rel_path,
             manifest=manifest,
@@ -103,52 +172,94 @@ def _scan_directory(
             contrast_app_name=contrast_app_name,
         ))
 
-    # Recurse into subdirectories
+    if not descend:
+        return modules, []
+
+    # Subdirectories to scan next, in name order
+    subdirs: list[tuple[Path, tuple[int, int]]] = []
+    for entry in sorted(entries, key=lambda e: e.name):
+        if entry.name.startswith(".") or entry.name in SKIP_DIRS or not _entry_is_dir(entry):
+            continue
+        child = Path(entry.path)
+        real = child.resolve()
+        if not real.is_relative_to(repo_root):
+            continue
+        if entry.is_symlink() and _walk_reaches(real.relative_to(repo_root).parts, depth):
+            # The walk covers the target under its real path; don't alias it
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        subdirs.append((child, (st.st_dev, st.st_ino)))
+    return modules, subdirs
+
+
+def _walk_reaches(rel_parts: tuple[str, ...], depth: int) -> bool:
+    """Whether the walk visits the directory at these repo-relative parts on its own."""
+    return len(rel_parts) <= depth and not any(
+        part.startswith(".") or part in SKIP_DIRS for part in rel_parts
+    )
+
+
+def _entry_is_file(entry: os.DirEntry) -> bool:
     try:
-        for child in sorted(dir_path.iterdir()):
-            if child.is_dir() and not child.name.startswith(".") and child.name not in SKIP_DIRS:
-                real = child.resolve()
-                if not real.is_relative_to(repo_root):
-                    continue
-                _scan_directory(child, repo_root, remaining_depth - 1, results)
-    except PermissionError:
-        pass
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
 
 
 _CONTRAST_YAML_NAMES = ("contrast_security.yaml", "contrast.yaml")
 
+_POM_NS_RE = re.compile(r"\{([^}]+)\}")
+_GRADLE_ROOT_NAME_RE = re.compile(r'rootProject\.name\s*=\s*["\'](.+?)["\']')
 
-def _contrast_app_name(dir_path: Path) -> Optional[str]:
-    """Extract application.name from contrast_security.yaml if present."""
+
+def _contrast_app_name(dir_path: Path, files: Optional[set[str]] = None) -> Optional[str]:
+    """Extract application.name from contrast_security.yaml if present.
+
+    files, when given, is the directory's file listing and saves a stat per name.
+    """
     for name in _CONTRAST_YAML_NAMES:
         yaml_path = dir_path / name
-        if not yaml_path.is_file():
+        if files is not None:
+            if name not in files:
+                continue
+        elif not yaml_path.is_file():
             continue
         try:
             # Simple line-based parse — avoids adding a yaml dependency.
+            # Streamed so reading stops at the name.
             # Looking for:
             #   application:
             #     name: some-app-name
-            lines = yaml_path.read_text(encoding="utf-8").splitlines()
-            in_application = False
-            for line in lines:
-                stripped = line.strip()
-                if stripped == "application:" or stripped.startswith("application:"):
-                    # Check for inline: application: {name: foo}
-                    after = stripped[len("application:"):].strip()
-                    if after:
-                        # Inline value — not the block form we expect
+            with yaml_path.open(encoding="utf-8") as lines:
+                in_application = False
+                for line in lines:
+                    stripped = line.strip()
+                    if stripped == "application:" or stripped.startswith("application:"):
+                        # Check for inline: application: {name: foo}
+                        after = stripped[len("application:"):].strip()
+                        if after:
+                            # Inline value — not the block form we expect
+                            continue
+                        in_application = True
                         continue
-                    in_application = True
-                    continue
-                if in_application:
-                    if line.startswith((" ", "\t")):
-                        if stripped.startswith("name:"):
-                            val = stripped[len("name:"):].strip().strip("'\"")
-                            if val:
-                                return val
-                    else:
-                        in_application = False
+                    if in_application:
+                        if line.startswith((" ", "\t")):
+                            if stripped.startswith("name:"):
+                                val = stripped[len("name:"):].strip().strip("'\"")
+                                if val:
+                                    return val
+                        else:
+                            in_application = False
         except Exception:
             continue
     return None
@@ -178,23 +289,40 @@ def _extract_name(dir_path: Path, manifest: Manifest) -> Optional[str]:
 
 def _name_from_package_json(path: Path) -> Optional[str]:
     """Extract 'name' from package.json."""
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = _json_loads(path.read_bytes())
     return data.get("name") or None
 
 
 def _name_from_pom_xml(path: Path) -> Optional[str]:
     """Extract 'groupId:artifactId' from pom.xml."""
-    tree = ET.parse(path)
-    root = tree.getroot()
+    # Stream the document and stop once both project-level coordinates are
+    # seen; they sit near the top, ahead of dependencies and build config.
     ns = ""
-    # Handle Maven namespace
-    match = re.match(r"\{(.+)\}", root.tag)
-    if match:
-        ns = f"{{{match.group(1)}}}"
-    artifact_id = root.findtext(f"{ns}artifactId")
+    depth = 0
+    found: dict[str, str] = {}
+    with path.open("rb") as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    # Handle Maven namespace
+                    match = _POM_NS_RE.match(elem.tag)
+                    if match:
+                        ns = f"{{{match.group(1)}}}"
+                continue
+            depth -= 1
+            if depth == 1:
+                # Only direct children of <project>, not <parent> coordinates
+                for key in ("artifactId", "groupId"):
+                    if elem.tag == f"{ns}{key}" and key not in found:
+                        found[key] = elem.text or ""
+                elem.clear()
+                if len(found) == 2:
+                    break
+    artifact_id = found.get("artifactId")
     if not artifact_id:
         return None
-    group_id = root.findtext(f"{ns}groupId")
+    group_id = found.get("groupId")
     if group_id:
         return f"{group_id}:{artifact_id}"
     return artifact_id
@@ -206,7 +334,7 @@ def _name_from_gradle(dir_path: Path) -> Optional[str]:
         settings = dir_path / name
         if settings.is_file():
             text = settings.read_text(encoding="utf-8")
-            match = re.search(r'rootProject\.name\s*=\s*["\'](.+?)["\']', text)
+            match = _GRADLE_ROOT_NAME_RE.search(text)
             if match:
                 return match.group(1)
     return None
@@ -218,19 +346,22 @@ def _name_from_pyproject_toml(path: Path) -> Optional[str]:
         import tomllib
     except ModuleNotFoundError:
         import tomli as tomllib  # type: ignore[no-redef]
-    data = tomllib.loads(path.read_text(encoding="utf-8"))
+    with path.open("rb") as f:
+        data = tomllib.load(f)
     return data.get("project", {}).get("name") or None
 
 
 def _name_from_go_mod(path: Path) -> Optional[str]:
     """Extract module path from go.mod."""
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if line.startswith("module "):
-            return line.split(None, 1)[1].strip()
+    # The module directive leads the file; stop reading once it is found.
+    with path.open(encoding="utf-8") as lines:
+        for line in lines:
+            if line.startswith("module "):
+                return line.split(None, 1)[1].strip()
     return None
 
 
 def _name_from_composer_json(path: Path) -> Optional[str]:
     """Extract 'name' from composer.json."""
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = _json_loads(path.read_bytes())
     return data.get("name") or None
@@ -0,0 +1,104 @@
+"""Tests for the on-disk org app list cache."""
+
+import os
+import stat
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from module_identifier.cache import _cache_path, cached_apps, load_apps, store_apps
+from module_identifier.config import ContrastConfig
+from module_identifier.resolver import AppCandidate
+
+
+def _config(org_id="org-1", host_name="app.contrastsecurity.com", username="u", api_key="k"):
+    return ContrastConfig(
+        host_name=host_name, api_key=api_key, service_key="s",
+        username=username, org_id=org_id,
+    )
+
+
+APPS = [AppCandidate("id1", "order-api", "Java"), AppCandidate("id2", "web", "Node")]
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+class TestLoadStore:
+    def test_round_trip(self):
+        store_apps(_config(), APPS)
+        assert load_apps(_config(), ttl=60) == APPS
+
+    def test_miss_when_absent(self):
+        assert load_apps(_config(), ttl=60) is None
+
+    def test_expired_entry_ignored(self):
+        store_apps(_config(), APPS)
+        old = time.time() - 120
+        os.utime(_cache_path(_config()), (old, old))
+        assert load_apps(_config(), ttl=60) is None
+
+    def test_future_mtime_is_a_miss(self):
+        store_apps(_config(), APPS)
+        future = time.time() + 3600
+        os.utime(_cache_path(_config()), (future, future))
+        assert load_apps(_config(), ttl=60) is None
+
+    def test_keyed_by_org_and_host(self):
+        store_apps(_config(), APPS)
+        assert load_apps(_config(org_id="org-2"), ttl=60) is None
+        assert load_apps(_config(host_name="eval.contrastsecurity.com"), ttl=60) is None
+
+    def test_keyed_by_user(self):
+        """App visibility depends on the user's permissions; entries aren't shared."""
+        store_apps(_config(), APPS)
+        assert load_apps(_config(username="someone-else"), ttl=60) is None
+        assert load_apps(_config(api_key="other-key"), ttl=60) is None
+
+    def test_corrupt_entry_is_a_miss(self):
+        store_apps(_config(), APPS)
+        _cache_path(_config()).write_text("{not json")
+        assert load_apps(_config(), ttl=60) is None
+
+    def test_written_owner_only(self):
+        store_apps(_config(), APPS)
+        mode = stat.S_IMODE(_cache_path(_config()).stat().st_mode)
+        assert mode & 0o077 == 0
+
+    def test_cleanup_failure_keeps_original_error(self):
+        with patch("module_identifier.cache.os.replace", side_effect=KeyboardInterrupt), \
+             patch("module_identifier.cache.os.unlink", side_effect=OSError("busy")):
+            with pytest.raises(KeyboardInterrupt):
+                store_apps(_config(), APPS)
+
+    def test_unwritable_cache_dir_is_ignored(self, cache_home):
+        (cache_home / "contrast-module-identifier").write_text("not a dir")
+        store_apps(_config(), APPS)  # no exception
+        assert load_apps(_config(), ttl=60) is None
+
+
+class TestCachedApps:
+    async def test_disabled_always_fetches(self):
+        store_apps(_config(), APPS)
+        fetch = AsyncMock(return_value=APPS[:1])
+        assert await cached_apps(_config(), None, fetch) == APPS[:1]
+        fetch.assert_awaited_once()
+
+    async def test_hit_skips_fetch(self):
+        store_apps(_config(), APPS)
+        fetch = AsyncMock()
+        assert await cached_apps(_config(), 60, fetch) == APPS
+        fetch.assert_not_awaited()
+
+    async def test_miss_fetches_and_stores(self):
+        fetch = AsyncMock(return_value=APPS)
+        assert await cached_apps(_config(), 60, fetch) == APPS
+        assert load_apps(_config(), ttl=60) == APPS
+
+    async def test_empty_result_not_cached(self):
+        await cached_apps(_config(), 60, AsyncMock(return_value=[]))
+        assert load_apps(_config(), ttl=60) is None
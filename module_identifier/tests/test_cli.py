@@ -1,5 +1,9 @@
-"""Tests for CLI --output-env flag."""
+"""Tests for CLI --output and --output-env flags."""
 
+import json
+import logging
+import os
+import stat
 import subprocess
 import sys
 from pathlib import Path
@@ -9,6 +13,8 @@ import pytest
 
 from module_identifier.config import ContrastConfig
 from module_identifier.llm import LLMConfig
+from module_identifier.llm.models import LLMMatch
+from module_identifier.pipeline import PipelineResult
 from module_identifier.models import DiscoveredModule, Ecosystem, Manifest
 from module_identifier.resolver import AppCandidate, AppMatch
 
@@ -36,8 +42,8 @@ def env_vars(monkeypatch):
     monkeypatch.setenv("CONTRAST_SERVICE_KEY", "s")
     monkeypatch.setenv("CONTRAST_USERNAME", "u")
     monkeypatch.setenv("CONTRAST_ORG_ID", "o")
-    # LLMConfig reads from .env via dotenv_values
-    monkeypatch.setattr("module_identifier.llm.config.dotenv_values", lambda: {
+    # LLMConfig reads from .env via _dotenv_env
+    monkeypatch.setattr("module_identifier.llm.config._dotenv_env", lambda: {
         "AGENT_MODEL": "anthropic/claude-sonnet-4-5",
         "ANTHROPIC_API_KEY": "test",
     })
@@ -48,7 +54,7 @@ class TestOutputEnv:
         env_file = tmp_path / "result.env"
         match = _match()
 
-        with patch("module_identifier.__main__.identify_repo", new_callable=AsyncMock, return_value=match):
+        with patch("module_identifier.identify.identify_repo", new_callable=AsyncMock, return_value=match):
             from module_identifier.__main__ import main
             sys.argv = ["prog", str(tmp_path), "--single", "--output-env", str(env_file)]
             main()
@@ -58,13 +64,26 @@ class TestOutputEnv:
     def test_no_match_writes_empty(self, tmp_path, env_vars):
         env_file = tmp_path / "result.env"
 
-        with patch("module_identifier.__main__.identify_repo", new_callable=AsyncMock, return_value=None):
+        with patch("module_identifier.identify.identify_repo", new_callable=AsyncMock, return_value=None):
             from module_identifier.__main__ import main
             sys.argv = ["prog", str(tmp_path), "--single", "--output-env", str(env_file)]
             main()
 
         assert env_file.read_text() == "APP_ID=\n"
 
+    def test_file_mode_follows_umask(self, tmp_path, env_vars):
+        env_file = tmp_path / "result.env"
+        old_umask = os.umask(0o002)
+        try:
+            with patch("module_identifier.identify.identify_repo", new_callable=AsyncMock, return_value=None):
+                from module_identifier.__main__ import main
+                sys.argv = ["prog", str(tmp_path), "--single", "--output-env", str(env_file)]
+                main()
+        finally:
+            os.umask(old_umask)
+
+        assert stat.S_IMODE(env_file.stat().st_mode) == 0o664
+
     def test_without_single_fails(self, tmp_path):
         env_file = tmp_path / "result.env"
 
@@ -75,3 +94,94 @@ class TestOutputEnv:
 
         assert exc_info.value.code == 1
         assert not env_file.exists()
+
+
+class TestOutput:
+    def test_single_writes_json(self, tmp_path, env_vars):
+        out_file = tmp_path / "result.json"
+
+        with patch("module_identifier.identify.identify_repo", new_callable=AsyncMock, return_value=_match()):
+            from module_identifier.__main__ import main
+            sys.argv = ["prog", str(tmp_path), "--single", "-o", str(out_file)]
+            main()
+
+        data = json.loads(out_file.read_text())
+        assert data["app_id"] == "abc-123"
+        assert data["app_name"] == "order-api"
+        assert data["source"] == "deterministic"
+        assert data["repo_path"] == str(tmp_path.resolve())
+
+    def test_modules_writes_json(self, tmp_path, env_vars):
+        out_file = tmp_path / "result.json"
+        result = PipelineResult(
+            matched={"services/order": _match()},
+            unmatched=["tools/codegen"],
+            llm_matched={"libs/mystery": LLMMatch(
+                application_id="app-99",
+                application_name="mystery-service",
+                confidence="MEDIUM",
+                reasoning="Found via README",
+            )},
+            total=3,
+        )
+
+        with patch("module_identifier.pipeline.run", new_callable=AsyncMock, return_value=result):
+            from module_identifier.__main__ import main
+            sys.argv = ["prog", str(tmp_path), "-o", str(out_file)]
+            main()
+
+        data = json.loads(out_file.read_text())
+        assert data["total_modules"] == 3
+        assert data["deterministic_matched"] == {"services/order": {
+            "app_id": "abc-123",
+            "app_name": "order-api",
+            "confidence": 0.95,
+            "search_term": "order-api",
+        }}
+        assert data["llm_matched"] == {"libs/mystery": {
+            "app_id": "app-99",
+            "app_name": "mystery-service",
+            "confidence": "MEDIUM",
+            "reasoning": "Found via README",
+        }}
+        assert data["unmatched"] == ["tools/codegen"]
+
+
+class TestLogging:
+    def test_quiet_skips_logging_setup(self, tmp_path, env_vars):
+        with patch("module_identifier.identify.identify_repo", new_callable=AsyncMock, return_value=None), \
+             patch("logging.basicConfig") as mock_basic_config:
+            from module_identifier.__main__ import main
+            sys.argv = ["prog", str(tmp_path), "--single", "--quiet"]
+            main()
+
+        mock_basic_config.assert_not_called()
+
+    def test_default_configures_info_logging(self, tmp_path, env_vars):
+        with patch("module_identifier.identify.identify_repo", new_callable=AsyncMock, return_value=None), \
+             patch("logging.basicConfig") as mock_basic_config:
+            from module_identifier.__main__ import main
+            sys.argv = ["prog", str(tmp_path), "--single"]
+            main()
+
+        assert mock_basic_config.call_args.kwargs["level"] == logging.INFO
+
+
+class TestAppCache:
+    def test_cache_enabled_by_default(self, tmp_path, env_vars):
+        from module_identifier.cache import DEFAULT_APP_CACHE_TTL
+
+        with patch("module_identifier.identify.identify_repo", new_callable=AsyncMock, return_value=None) as mock:
+            from module_identifier.__main__ import main
+            sys.argv = ["prog", str(tmp_path), "--single", "--quiet"]
+            main()
+
+        assert mock.call_args.kwargs["app_cache_ttl"] == DEFAULT_APP_CACHE_TTL
+
+    def test_no_cache_disables(self, tmp_path, env_vars):
+        with patch("module_identifier.identify.identify_repo", new_callable=AsyncMock, return_value=None) as mock:
+            from module_identifier.__main__ import main
+            sys.argv = ["prog", str(tmp_path), "--single", "--quiet", "--no-cache"]
+            main()
+
+        assert mock.call_args.kwargs["app_cache_ttl"] is None
@@ -25,6 +25,20 @@ class TestDecodeAuthToken:
         with pytest.raises(ValueError, match="base64"):
             _decode_auth_token(token)
 
+    def test_invalid_characters_raise(self):
+        token = base64.b64encode(b"user:svc-key").decode()
+        with pytest.raises(ValueError, match="base64"):
+            _decode_auth_token(token[:4] + "!" + token[4:])
+
+    def test_non_ascii_raises(self):
+        token = base64.b64encode(b"user:svc-key").decode()
+        with pytest.raises(ValueError, match="base64"):
+            _decode_auth_token(token + "\u00e9")
+
+    def test_surrounding_whitespace_ignored(self):
+        token = base64.b64encode(b"user:svc-key").decode()
+        assert _decode_auth_token(f"  {token}\n") == ("user", "svc-key")
+
 
 class TestFromEnv:
     _ALL_VARS = [
@@ -91,3 +105,52 @@ class TestFromEnv:
         monkeypatch.setenv("CONTRAST_SERVICE_KEY", "svc")
         with pytest.raises(ValueError, match="CONTRAST_HOST_NAME"):
             ContrastConfig.from_env()
+
+
+class TestAsEnv:
+    def test_maps_fields_to_env_vars(self):
+        config = ContrastConfig(
+            host_name="h", api_key="k", service_key="s", username="u", org_id="o",
+        )
+        assert config.as_env() == {
+            "CONTRAST_HOST_NAME": "h",
+            "CONTRAST_API_KEY": "k",
+            "CONTRAST_SERVICE_KEY": "s",
+            "CONTRAST_USERNAME": "u",
+            "CONTRAST_ORG_ID": "o",
+        }
+
+    def test_returns_independent_copies(self):
+        config = ContrastConfig(
+            host_name="h", api_key="k", service_key="s", username="u", org_id="o",
+        )
+        env = config.as_env()
+        env["PATH"] = "/usr/bin"
+        assert "PATH" not in config.as_env()
+
+
+class TestDerivedValues:
+    def test_basic_auth_header_round_trips(self):
+        config = ContrastConfig(
+            host_name="h", api_key="k", service_key="svc-key", username="alice", org_id="o",
+        )
+        assert _decode_auth_token(config.basic_auth_header) == ("alice", "svc-key")
+        assert config.basic_auth_header not in repr(config)
+
+    def test_llm_proxy_url(self):
+        config = ContrastConfig(
+            host_name="app.example.com/", api_key="k", service_key="s", username="u", org_id="org-1",
+        )
+        assert config.llm_proxy_url == "https://app.example.com/api/llm-proxy/v2/organizations/org-1/anthropic"
+
+
+class TestSubprocessEnv:
+    def test_adds_current_path(self, monkeypatch):
+        config = ContrastConfig(
+            host_name="h", api_key="k", service_key="s", username="u", org_id="o",
+        )
+        monkeypatch.setenv("PATH", "/opt/bin")
+        env = config.subprocess_env()
+        assert env["PATH"] == "/opt/bin"
+        assert env["CONTRAST_API_KEY"] == "k"
+        assert "PATH" not in config.as_env()
@@ -69,6 +69,75 @@ class TestMavenModules:
         modules = _maven_modules(tmp_repo)
         assert modules == []
 
+    def test_ignores_profile_modules(self, tmp_repo):
+        (tmp_repo / "pom.xml").write_text("""<?xml version="1.0"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <profiles>
+        <profile>
+            <modules><module>profile-only</module></modules>
+        </profile>
+    </profiles>
+    <modules><module>core</module></modules>
+</project>""")
+        for name in ("profile-only", "core"):
+            d = tmp_repo / name
+            d.mkdir()
+            (d / "pom.xml").write_text(f"<project><artifactId>{name}</artifactId></project>")
+
+        modules = _maven_modules(tmp_repo)
+        assert [m.name for m in modules] == ["core"]
+
+    def test_rejects_paths_outside_repo(self, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "pom.xml").write_text("<project><artifactId>outside</artifactId></project>")
+        (repo / "escape").symlink_to(outside)
+        (repo / "pom.xml").write_text(
+            "<project><modules>"
+            "<module>../outside</module><module>escape</module>"
+            "</modules></project>"
+        )
+
+        assert _maven_modules(repo) == []
+
+    def test_malformed_child_pom_falls_back_to_dir_name(self, tmp_repo):
+        (tmp_repo / "pom.xml").write_text(
+            "<project><modules><module>good</module><module>broken</module></modules></project>"
+        )
+        (tmp_repo / "good").mkdir()
+        (tmp_repo / "good" / "pom.xml").write_text("<project><artifactId>good-api</artifactId></project>")
+        (tmp_repo / "broken").mkdir()
+        (tmp_repo / "broken" / "pom.xml").write_text("<project><artifactId>")
+
+        modules = _maven_modules(tmp_repo)
+        assert [m.name for m in modules] == ["good-api", "broken"]
+
+    def test_malformed_parent_pom(self, tmp_repo):
+        (tmp_repo / "pom.xml").write_text("<project><modules>")
+        assert _maven_modules(tmp_repo) == []
+
+    def test_no_namespace(self, tmp_repo):
+        (tmp_repo / "pom.xml").write_text(
+            "<project><modules><module>core</module></modules></project>"
+        )
+        (tmp_repo / "core").mkdir()
+        (tmp_repo / "core" / "pom.xml").write_text("<project><artifactId>core</artifactId></project>")
+
+        modules = _maven_modules(tmp_repo)
+        assert [m.path for m in modules] == ["core"]
+
+    def test_stat_results_not_reused_across_calls(self, tmp_repo):
+        (tmp_repo / "pom.xml").write_text(
+            "<project><modules><module>core</module></modules></project>"
+        )
+        assert _maven_modules(tmp_repo) == []
+
+        (tmp_repo / "core").mkdir()
+        (tmp_repo / "core" / "pom.xml").write_text("<project><artifactId>core</artifactId></project>")
+        assert [m.path for m in _maven_modules(tmp_repo)] == ["core"]
+
 
 # --- Gradle ---
 
@@ -121,6 +190,60 @@ class TestGradleModules:
         assert len(modules) == 1
         assert modules[0].name == "enabled"
 
+    def test_commented_out_multiline_arg(self, tmp_repo):
+        (tmp_repo / "settings.gradle.kts").write_text(
+            'include(\n'
+            '    "mod-a",\n'
+            '    // "mod-b",\n'
+            ')\n'
+            '// findProject(":mod-a")?.name = "renamed"\n'
+        )
+        (tmp_repo / "mod-a").mkdir()
+        (tmp_repo / "mod-b").mkdir()
+
+        modules = _gradle_modules(tmp_repo)
+        assert [m.name for m in modules] == ["mod-a"]
+
+    def test_paren_in_commented_line_inside_include(self, tmp_repo):
+        (tmp_repo / "settings.gradle.kts").write_text(
+            'include(\n'
+            '  // ("old")\n'
+            '  "a"\n'
+            ')\n'
+        )
+        (tmp_repo / "a").mkdir()
+        (tmp_repo / "old").mkdir()
+
+        modules = _gradle_modules(tmp_repo)
+        assert [m.name for m in modules] == ["a"]
+
+    def test_comment_with_parens_inside_include(self, tmp_repo):
+        (tmp_repo / "settings.gradle").write_text(
+            'include(\n'
+            '  // removed (see #12)\n'
+            '  "a",\n'
+            '  "b"\n'
+            ')\n'
+        )
+        (tmp_repo / "a").mkdir()
+        (tmp_repo / "b").mkdir()
+
+        modules = _gradle_modules(tmp_repo)
+        assert [m.name for m in modules] == ["a", "b"]
+
+    def test_nested_siblings(self, tmp_path):
+        repo = tmp_path / "repo"
+        (repo / "services" / "api").mkdir(parents=True)
+        (repo / "services" / "worker").mkdir()
+        (tmp_path / "outside").mkdir()
+        (repo / "services" / "escape").symlink_to(tmp_path / "outside")
+        (repo / "settings.gradle.kts").write_text(
+            'include(":services:api", ":services:missing", ":services:worker", ":services:escape")\n'
+        )
+
+        modules = _gradle_modules(repo)
+        assert [m.path for m in modules] == ["services/api", "services/worker"]
+
     def test_find_project_rename(self, tmp_repo):
         (tmp_repo / "settings.gradle.kts").write_text(
             'include("services:old-name")\n'
@@ -132,6 +255,15 @@ class TestGradleModules:
         assert len(modules) == 1
         assert modules[0].name == "new-name"
 
+    def test_find_project_rename_same_line_as_include(self, tmp_repo):
+        (tmp_repo / "settings.gradle.kts").write_text(
+            'include ":a"; findProject(":a")?.name = "alpha"\n'
+        )
+        (tmp_repo / "a").mkdir()
+
+        modules = _gradle_modules(tmp_repo)
+        assert [m.name for m in modules] == ["alpha"]
+
     def test_no_settings(self, tmp_repo):
         modules = _gradle_modules(tmp_repo)
         assert modules == []
@@ -179,6 +311,37 @@ class TestNodeWorkspaces:
         assert len(modules) == 1
         assert modules[0].name == "web-app"
 
+    def test_literal_workspaces(self, tmp_repo):
+        (tmp_repo / "package.json").write_text(json.dumps({
+            "name": "root",
+            "workspaces": ["packages/a", "packages/missing", "tools/cli"],
+        }))
+        for rel, name in (("packages/a", "pkg-a"), ("tools/cli", "cli")):
+            d = tmp_repo / rel
+            d.mkdir(parents=True)
+            (d / "package.json").write_text(json.dumps({"name": name}))
+
+        modules = _node_workspaces(tmp_repo)
+        assert [(m.name, m.path) for m in modules] == [
+            ("pkg-a", "packages/a"),
+            ("cli", "tools/cli"),
+        ]
+
+    def test_skips_invalid_workspace_entries(self, tmp_repo):
+        (tmp_repo / "package.json").write_text(json.dumps({
+            "workspaces": [42, None, "", "/abs/*", "packages/a"],
+        }))
+        d = tmp_repo / "packages" / "a"
+        d.mkdir(parents=True)
+        (d / "package.json").write_text(json.dumps({"name": "pkg-a"}))
+
+        modules = _node_workspaces(tmp_repo)
+        assert [m.name for m in modules] == ["pkg-a"]
+
+    def test_non_object_package_json(self, tmp_repo):
+        (tmp_repo / "package.json").write_text("[]")
+        assert _node_workspaces(tmp_repo) == []
+
     def test_no_workspaces(self, tmp_repo):
         (tmp_repo / "package.json").write_text(json.dumps({"name": "solo"}))
         modules = _node_workspaces(tmp_repo)
@@ -255,3 +418,11 @@ class TestDiscoverDeclaredModules:
         ecosystems = {m.ecosystem for m in modules}
         assert Ecosystem.JAVA in ecosystems
         assert Ecosystem.NODE in ecosystems
+
+    def test_rescan_sees_filesystem_changes(self, tmp_repo):
+        (tmp_repo / "settings.gradle").write_text("include 'mod-a'\n")
+        assert discover_declared_modules(tmp_repo) == []
+
+        (tmp_repo / "mod-a").mkdir()
+        modules = discover_declared_modules(tmp_repo)
+        assert [m.name for m in modules] == ["mod-a"]
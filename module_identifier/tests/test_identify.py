@@ -1,11 +1,13 @@
 """Tests for identify_repo() — EA entry point."""
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from module_identifier.config import ContrastConfig
-from module_identifier.identify import _best_deterministic_match, _is_ambiguous, identify_repo
+from module_identifier.identify import _best_deterministic_match, identify_repo
 from module_identifier.llm import LLMConfig
 from module_identifier.models import DiscoveredModule, Ecosystem, Manifest
 from module_identifier.resolver import AppCandidate, AppMatch
@@ -39,7 +41,7 @@ class TestBestDeterministicMatch:
     def test_single_module_exact_match(self):
         modules = [_module("order-api")]
         candidates = [_candidate("order-api")]
-        best = _best_deterministic_match(modules, candidates)
+        best, _ = _best_deterministic_match(modules, candidates)
         assert best is not None
         assert best.app_name == "order-api"
         assert best.confidence == 1.0
@@ -50,34 +52,34 @@ class TestBestDeterministicMatch:
             _module("order-api", path="backend"),
         ]
         candidates = [_candidate("order-api")]
-        best = _best_deterministic_match(modules, candidates)
+        best, _ = _best_deterministic_match(modules, candidates)
         assert best is not None
         assert best.module.name == "order-api"
 
     def test_no_candidates_returns_none(self):
         modules = [_module("order-api")]
-        assert _best_deterministic_match(modules, []) is None
+        assert _best_deterministic_match(modules, []) == (None, False)
 
     def test_no_modules_returns_none(self):
         candidates = [_candidate("order-api")]
-        assert _best_deterministic_match([], candidates) is None
+        assert _best_deterministic_match([], candidates) == (None, False)
 
     def test_no_overlap_returns_low_score(self):
         modules = [_module("xyz-service")]
         candidates = [_candidate("abc-app")]
-        best = _best_deterministic_match(modules, candidates)
+        best, _ = _best_deterministic_match(modules, candidates)
         # Still returns something (threshold=0.0) but low confidence
         assert best is None or best.confidence < 0.5
 
 
-# --- _is_ambiguous ---
+# --- ambiguity ---
 
 
-class TestIsAmbiguous:
+class TestAmbiguity:
     def test_single_strong_candidate_not_ambiguous(self):
         module = _module("order-api")
         candidates = [_candidate("order-api"), _candidate("zzz-unrelated")]
-        assert not _is_ambiguous(module, candidates)
+        assert not _best_deterministic_match([module], candidates)[1]
 
     def test_multiple_strong_candidates_is_ambiguous(self):
         """employee-management case: exact match + prefixed variant both score high."""
@@ -86,12 +88,28 @@ class TestIsAmbiguous:
             _candidate("employee-management", app_id="a1"),
             _candidate("alex-employee-management", app_id="a2"),
         ]
-        assert _is_ambiguous(module, candidates)
+        assert _best_deterministic_match([module], candidates)[1]
+
+    def test_reports_ambiguity_of_best_module_only(self):
+        # "employee-portal" has two candidates above the floor, but "order-api" wins
+        modules = [
+            _module("employee-portal", Manifest.PACKAGE_JSON, Ecosystem.NODE, path="a"),
+            _module("order-api", path="b"),
+        ]
+        candidates = [
+            _candidate("employee-portal-web", app_id="a1", language="Node"),
+            _candidate("employee-portal-api", app_id="a2", language="Node"),
+            _candidate("order-api", app_id="a3"),
+        ]
+        assert _best_deterministic_match(modules[:1], candidates)[1]
+        best, ambiguous = _best_deterministic_match(modules, candidates)
+        assert best.app_id == "a3"
+        assert not ambiguous
 
     def test_no_strong_candidates_not_ambiguous(self):
         module = _module("xyz-service")
         candidates = [_candidate("abc-app"), _candidate("def-app")]
-        assert not _is_ambiguous(module, candidates)
+        assert not _best_deterministic_match([module], candidates)[1]
 
 
 # --- identify_repo ---
@@ -121,7 +139,63 @@ class TestIdentifyRepo:
         assert result.confidence == 1.0
         assert result.source == "deterministic"
 
-    @patch("module_identifier.llm.agent.resolve_module")
+    @patch("module_identifier.identify.ContrastMCP")
+    @patch("module_identifier.identify.discover_modules")
+    async def test_reuses_open_mcp_session(self, mock_discover, mock_mcp_cls, tmp_path, config, llm_config):
+        mock_discover.return_value = [_module("order-api")]
+        session = _mock_mcp([_candidate("order-api")])
+
+        result = await identify_repo(tmp_path, config, llm_config, mcp=session)
+
+        assert result is not None
+        assert result.app_name == "order-api"
+        mock_mcp_cls.assert_not_called()
+        session.list_applications.assert_awaited_once()
+
+    @patch("module_identifier.identify.ContrastMCP")
+    @patch("module_identifier.identify.discover_modules")
+    async def test_discovery_runs_off_event_loop(self, mock_discover, mock_mcp_cls, tmp_path, config, llm_config):
+        loop_thread = threading.get_ident()
+        discover_threads = []
+
+        def discover(*args, **kwargs):
+            discover_threads.append(threading.get_ident())
+            return [_module("order-api")]
+
+        mock_discover.side_effect = discover
+        mock_mcp_cls.return_value = _mock_mcp([_candidate("order-api")])
+
+        result = await identify_repo(tmp_path, config, llm_config)
+
+        assert result is not None
+        assert discover_threads and discover_threads[0] != loop_thread
+
+    @patch("module_identifier.identify.ContrastMCP")
+    @patch("module_identifier.identify.discover_modules")
+    async def test_discovery_error_cancels_app_fetch(self, mock_discover, mock_mcp_cls, tmp_path, config, llm_config):
+        fetch_started = threading.Event()
+
+        async def hang():
+            fetch_started.set()
+            await asyncio.Event().wait()
+
+        def discover(*args, **kwargs):
+            fetch_started.wait(timeout=5)
+            raise PermissionError("denied")
+
+        mcp = _mock_mcp([])
+        mcp.list_applications = AsyncMock(side_effect=hang)
+        mock_mcp_cls.return_value = mcp
+        mock_discover.side_effect = discover
+
+        with pytest.raises(PermissionError):
+            await identify_repo(tmp_path, config, llm_config)
+
+        # The server context was left (via cancellation) before the error surfaced
+        mcp.__aexit__.assert_awaited_once()
+        assert mcp.__aexit__.await_args.args[0] is asyncio.CancelledError
+
+    @patch("module_identifier.identify.llm_resolve")
     @patch("module_identifier.identify.ContrastMCP")
     @patch("module_identifier.identify.discover_modules")
     async def test_below_threshold_returns_llm(self, mock_discover, mock_mcp_cls, mock_llm, tmp_path, config, llm_config):
@@ -180,11 +254,11 @@ class TestIdentifyRepo:
         assert result is not None
 
         # High threshold — same match should fail (falls to LLM)
-        with patch("module_identifier.llm.agent.resolve_module", return_value=None):
+        with patch("module_identifier.identify.llm_resolve", return_value=None):
             result = await identify_repo(tmp_path, config, llm_config, confidence_threshold=0.99)
         assert result is None
 
-    @patch("module_identifier.llm.agent.resolve_module")
+    @patch("module_identifier.identify.llm_resolve")
     @patch("module_identifier.identify.ContrastMCP")
     @patch("module_identifier.identify.discover_modules")
     async def test_llm_fallback(self, mock_discover, mock_mcp_cls, mock_llm, tmp_path, config, llm_config):
@@ -208,7 +282,7 @@ class TestIdentifyRepo:
         assert result.source == "llm"
         mock_llm.assert_called_once()
 
-    @patch("module_identifier.llm.agent.resolve_module")
+    @patch("module_identifier.identify.llm_resolve")
     @patch("module_identifier.identify.ContrastMCP")
     @patch("module_identifier.identify.discover_modules")
     async def test_llm_not_found_returns_none(self, mock_discover, mock_mcp_cls, mock_llm, tmp_path, config, llm_config):
@@ -220,7 +294,7 @@ class TestIdentifyRepo:
         result = await identify_repo(tmp_path, config, llm_config)
         assert result is None
 
-    @patch("module_identifier.llm.agent.resolve_module")
+    @patch("module_identifier.identify.llm_resolve")
     @patch("module_identifier.identify.ContrastMCP")
     @patch("module_identifier.identify.discover_modules")
     async def test_ambiguous_triggers_llm(self, mock_discover, mock_mcp_cls, mock_llm, tmp_path, config, llm_config):
@@ -245,7 +319,7 @@ class TestIdentifyRepo:
         assert result.source == "llm"
         mock_llm.assert_called_once()
 
-    @patch("module_identifier.llm.agent.resolve_module")
+    @patch("module_identifier.identify.llm_resolve")
     @patch("module_identifier.identify.ContrastMCP")
     @patch("module_identifier.identify.discover_modules")
     async def test_ambiguous_llm_not_found(self, mock_discover, mock_mcp_cls, mock_llm, tmp_path, config, llm_config):
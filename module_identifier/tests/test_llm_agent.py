@@ -1,5 +1,6 @@
 """Tests for LLM agent — instruction building, scoring context, and message trimming."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
@@ -10,6 +11,7 @@ from module_identifier.llm.agent import (
     _score_all_candidates,
     _trim_messages,
     resolve_module,
+    resolve_modules,
     AGENT_INSTRUCTIONS,
     TOP_N_CANDIDATES,
     MAX_MESSAGES_BEFORE_TRIM,
@@ -84,6 +86,14 @@ class TestScoreAllCandidates:
         module = _module()
         assert _score_all_candidates(module, []) == []
 
+    def test_keeps_only_top_n(self):
+        module = _module(name="order-api")
+        candidates = [_candidate(name=f"app-{i}", app_id=str(i)) for i in range(TOP_N_CANDIDATES + 3)]
+        candidates.append(_candidate(name="order-api", app_id="best"))
+        scored = _score_all_candidates(module, candidates)
+        assert len(scored) == TOP_N_CANDIDATES
+        assert scored[0][0].app_id == "best"
+
 
 class TestAgentInstructions:
     def test_placeholders_present(self):
@@ -277,3 +287,137 @@ class TestResolveModule:
             )
 
         assert result is None
+
+
+class TestResolveModules:
+    def _llm_config(self):
+        return LLMConfig(provider="anthropic", model_name="claude-sonnet-4-5", anthropic_api_key="sk-test")
+
+    def _contrast_config(self):
+        return ContrastConfig(
+            host_name="test", api_key="k", service_key="s",
+            username="u", org_id="o",
+        )
+
+    async def test_preserves_module_order(self):
+        modules = [_module(name=f"mod-{i}", path=f"libs/mod-{i}") for i in range(4)]
+
+        async def fake_resolve(module, **kwargs):
+            # Finish in reverse order to prove results aren't ordered by completion
+            await asyncio.sleep(0.01 * (4 - int(module.name[-1])))
+            return None if module.name == "mod-2" else MagicMock(application_name=module.name)
+
+        with patch("module_identifier.llm.agent.create_mcp_toolsets", new_callable=AsyncMock, return_value=[]), \
+             patch("module_identifier.llm.agent.resolve_module", side_effect=fake_resolve):
+            results = await resolve_modules(
+                modules=modules,
+                candidates=[],
+                llm_config=self._llm_config(),
+                contrast_config=self._contrast_config(),
+                repo_path="/tmp/repo",
+            )
+
+        assert list(results) == [m.path for m in modules]
+        assert results["libs/mod-2"] is None
+        assert results["libs/mod-3"].application_name == "mod-3"
+
+    async def test_respects_max_concurrency(self):
+        modules = [_module(name=f"mod-{i}", path=f"libs/mod-{i}") for i in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_resolve(module, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return None
+
+        with patch("module_identifier.llm.agent.create_mcp_toolsets", new_callable=AsyncMock, return_value=[]), \
+             patch("module_identifier.llm.agent.resolve_module", side_effect=fake_resolve):
+            await resolve_modules(
+                modules=modules,
+                candidates=[],
+                llm_config=self._llm_config(),
+                contrast_config=self._contrast_config(),
+                repo_path="/tmp/repo",
+                max_concurrency=2,
+            )
+
+        assert peak == 2
+
+    async def test_starts_mcp_servers_once_per_batch(self):
+        modules = [_module(name=f"mod-{i}", path=f"libs/mod-{i}") for i in range(3)]
+        toolset = MagicMock()
+        toolset.__aenter__ = AsyncMock(return_value=toolset)
+        toolset.__aexit__ = AsyncMock(return_value=None)
+        seen_toolsets = []
+
+        async def fake_resolve(module, toolsets, **kwargs):
+            seen_toolsets.append(toolsets)
+            return None
+
+        with patch("module_identifier.llm.agent.create_mcp_toolsets", new_callable=AsyncMock, return_value=[toolset]) as mock_create, \
+             patch("module_identifier.llm.agent.resolve_module", side_effect=fake_resolve):
+            await resolve_modules(
+                modules=modules,
+                candidates=[],
+                llm_config=self._llm_config(),
+                contrast_config=self._contrast_config(),
+                repo_path="/tmp/repo",
+            )
+
+        mock_create.assert_awaited_once()
+        toolset.__aenter__.assert_awaited_once()
+        toolset.__aexit__.assert_awaited_once()
+        assert seen_toolsets == [[toolset]] * 3
+
+    async def test_mcp_startup_failure_returns_none(self):
+        modules = [_module(name="a", path="libs/a"), _module(name="b", path="libs/b")]
+        toolset = MagicMock()
+        toolset.__aenter__ = AsyncMock(side_effect=OSError("npx not found"))
+        toolset.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("module_identifier.llm.agent.create_mcp_toolsets", new_callable=AsyncMock, return_value=[toolset]), \
+             patch("module_identifier.llm.agent.resolve_module") as mock_resolve:
+            results = await resolve_modules(
+                modules=modules,
+                candidates=[],
+                llm_config=self._llm_config(),
+                contrast_config=self._contrast_config(),
+                repo_path="/tmp/repo",
+            )
+
+        assert results == {"libs/a": None, "libs/b": None}
+        mock_resolve.assert_not_called()
+
+    async def test_setup_failure_in_one_run_does_not_outlive_toolsets(self):
+        modules = [_module(name="bad", path="libs/bad"), _module(name="slow", path="libs/slow")]
+        toolset = MagicMock()
+        toolset.__aenter__ = AsyncMock(return_value=toolset)
+        toolset.__aexit__ = AsyncMock(return_value=None)
+        finished = []
+
+        async def fake_resolve(module, **kwargs):
+            if module.name == "bad":
+                raise ValueError("unknown provider")
+            await asyncio.sleep(0.02)
+            assert not toolset.__aexit__.await_count, "toolsets closed while run in flight"
+            finished.append(module.name)
+            return MagicMock(application_name="slow-app")
+
+        with patch("module_identifier.llm.agent.create_mcp_toolsets", new_callable=AsyncMock, return_value=[toolset]), \
+             patch("module_identifier.llm.agent.resolve_module", side_effect=fake_resolve):
+            results = await resolve_modules(
+                modules=modules,
+                candidates=[],
+                llm_config=self._llm_config(),
+                contrast_config=self._contrast_config(),
+                repo_path="/tmp/repo",
+            )
+
+        assert results["libs/bad"] is None
+        assert results["libs/slow"].application_name == "slow-app"
+        assert finished == ["slow"]
+        toolset.__aexit__.assert_awaited_once()
@@ -1,7 +1,15 @@
 """Tests for LLM configuration."""
 
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
 import pytest
-from module_identifier.llm.config import LLMConfig, _parse_agent_model, DEFAULT_CONTRAST_MODEL
+from module_identifier.llm.config import (
+    LLMConfig, _VALIDATORS, _dotenv_env, _parse_agent_model,
+    DEFAULT_CONTRAST_MODEL, VALID_PROVIDERS,
+)
 
 
 class TestParseAgentModel:
@@ -29,6 +37,14 @@ class TestParseAgentModel:
         provider, model = _parse_agent_model("Bedrock/some-model")
         assert provider == "bedrock"
 
+    def test_provider_is_interned(self):
+        provider, _ = _parse_agent_model(" Gemini /some-model")
+        assert provider is sys.intern("gemini")
+
+    def test_splits_on_first_slash_and_strips(self):
+        provider, model = _parse_agent_model(" bedrock / arn:aws/profile-1 \n")
+        assert (provider, model) == ("bedrock", "arn:aws/profile-1")
+
     def test_no_slash_raises(self):
         with pytest.raises(ValueError, match="must use provider/model format"):
             _parse_agent_model("just-a-model")
@@ -43,6 +59,9 @@ class TestParseAgentModel:
 
 
 class TestLLMConfigValidation:
+    def test_every_provider_has_a_validator(self):
+        assert set(_VALIDATORS) == set(VALID_PROVIDERS)
+
     def test_bedrock_valid(self):
         config = LLMConfig(
             provider="bedrock",
@@ -142,9 +161,9 @@ class TestLLMConfigValidation:
 
 
 def _mock_dotenv(values):
-    """Return a monkeypatch helper that mocks dotenv_values to return the given dict."""
+    """Return a monkeypatch helper that mocks the .env loader to return the given dict."""
     def patcher(monkeypatch):
-        monkeypatch.setattr("module_identifier.llm.config.dotenv_values", lambda: values)
+        monkeypatch.setattr("module_identifier.llm.config._dotenv_env", lambda: values)
     return patcher
 
 
@@ -232,6 +251,25 @@ class TestLLMConfigFromEnv:
         with pytest.raises(ValueError, match="AWS_ACCESS_KEY_ID"):
             LLMConfig.from_env()
 
+    def test_from_env_reuses_validated_instance(self, monkeypatch):
+        _mock_dotenv({
+            "AGENT_MODEL": "anthropic/claude-sonnet-4-5",
+            "ANTHROPIC_API_KEY": "sk-test",
+        })(monkeypatch)
+        first = LLMConfig.from_env()
+
+        with patch.object(LLMConfig, "_validate", side_effect=AssertionError("revalidated")):
+            assert LLMConfig.from_env() is first
+
+    def test_from_env_changed_values_build_new_instance(self, monkeypatch):
+        _mock_dotenv({"AGENT_MODEL": "anthropic/claude-sonnet-4-5", "ANTHROPIC_API_KEY": "sk-a"})(monkeypatch)
+        first = LLMConfig.from_env()
+        _mock_dotenv({"AGENT_MODEL": "anthropic/claude-sonnet-4-5", "ANTHROPIC_API_KEY": "sk-b"})(monkeypatch)
+        second = LLMConfig.from_env()
+
+        assert second is not first
+        assert second.anthropic_api_key == "sk-b"
+
 
 class TestLLMConfigFromEnvFailure:
     """Verify from_env() produces correct error messages with SmartFix-aligned env var names."""
@@ -289,3 +327,37 @@ class TestLLMConfigDefaults:
     def test_debug_default_false(self):
         config = LLMConfig(provider="anthropic", model_name="claude-sonnet-4-5", anthropic_api_key="sk-test")
         assert config.debug is False
+
+
+class TestDotenvEnv:
+    def test_dotenv_not_imported_by_config_module(self):
+        code = (
+            "import sys; import module_identifier.llm.config; "
+            "sys.exit('dotenv' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_reuses_parse_until_file_changes(self, tmp_path, monkeypatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text("AGENT_MODEL=anthropic/claude-sonnet-4-5\n")
+        monkeypatch.setattr("dotenv.find_dotenv", lambda: str(env_file))
+
+        first = _dotenv_env()
+        assert first["AGENT_MODEL"] == "anthropic/claude-sonnet-4-5"
+        assert _dotenv_env() is first
+
+        env_file.write_text("AGENT_MODEL=gemini/gemini-2.0-flash\n")
+        os.utime(env_file, ns=(0, 0))
+        assert _dotenv_env()["AGENT_MODEL"] == "gemini/gemini-2.0-flash"
+
+    def test_read_only(self, tmp_path, monkeypatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text("DEBUG_LOGGING=true\n")
+        monkeypatch.setattr("dotenv.find_dotenv", lambda: str(env_file))
+
+        with pytest.raises(TypeError):
+            _dotenv_env()["DEBUG_LOGGING"] = "false"
+
+    def test_no_env_file(self, monkeypatch):
+        monkeypatch.setattr("dotenv.find_dotenv", lambda: "")
+        assert dict(_dotenv_env()) == {}
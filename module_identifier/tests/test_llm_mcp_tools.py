@@ -1,6 +1,7 @@
 """Tests for LLM MCP toolset setup."""
 
 import os
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -8,9 +9,20 @@ import pytest
 from module_identifier.config import ContrastConfig
 from module_identifier.llm.mcp_tools import (
     create_mcp_toolsets,
+    _is_contrast_tool,
+    _is_filesystem_tool,
     FILESYSTEM_TOOLS,
     CONTRAST_TOOLS,
 )
+from module_identifier.mcp_contrast import _jar_exists
+
+
+@pytest.fixture(autouse=True)
+def _clear_jar_cache():
+    # Tests patch os.path.isfile; don't let a cached answer leak between them
+    _jar_exists.cache_clear()
+    yield
+    _jar_exists.cache_clear()
 
 
 def _contrast_config():
@@ -43,6 +55,12 @@ class TestToolSets:
         assert len(CONTRAST_TOOLS) == 1
         assert "contrast__search_applications" in CONTRAST_TOOLS
 
+    def test_filter_predicates(self):
+        assert _is_filesystem_tool(None, SimpleNamespace(name="fs__read_text_file"))
+        assert not _is_filesystem_tool(None, SimpleNamespace(name="fs__write_file"))
+        assert _is_contrast_tool(None, SimpleNamespace(name="contrast__search_applications"))
+        assert not _is_contrast_tool(None, SimpleNamespace(name="contrast__list_vulnerabilities"))
+
 
 class TestCreateMCPToolsets:
     @patch("pydantic_ai.mcp.MCPServerStdio")
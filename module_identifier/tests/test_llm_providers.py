@@ -1,10 +1,22 @@
 """Tests for LLM provider factory."""
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, MagicMock
 from module_identifier.config import ContrastConfig
 from module_identifier.llm.config import LLMConfig, DEFAULT_CONTRAST_MODEL
-from module_identifier.llm.providers import get_model
+from module_identifier.llm.providers import _bedrock_client, _cached_model, _contrast_client, get_model
+
+
+@pytest.fixture(autouse=True)
+def _clear_model_cache():
+    caches = (_cached_model, _bedrock_client, _contrast_client)
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
 
 
 def _make_contrast_config(**overrides):
@@ -20,6 +32,19 @@ def _make_contrast_config(**overrides):
 
 
 class TestGetModel:
+    @patch("module_identifier.llm.providers._create_anthropic_model")
+    def test_reuses_model_for_same_config(self, mock_create):
+        config = LLMConfig(provider="anthropic", model_name="claude-sonnet-4-5", anthropic_api_key="sk-test")
+        assert get_model(config) is get_model(config)
+        mock_create.assert_called_once_with(config)
+
+    @patch("module_identifier.llm.providers._create_anthropic_model")
+    async def test_new_model_per_event_loop(self, mock_create):
+        config = LLMConfig(provider="anthropic", model_name="claude-sonnet-4-5", anthropic_api_key="sk-test")
+        get_model(config)  # inside this test's loop
+        await asyncio.to_thread(get_model, config)  # no running loop in the worker thread
+        assert mock_create.call_count == 2
+
     def test_unknown_provider_raises(self):
         with pytest.raises(ValueError, match="Unknown provider"):
             LLMConfig(provider="unknown", model_name="x")
@@ -129,6 +154,46 @@ class TestBedrockModelCreation:
             bedrock_client=mock_session_cls.return_value.client.return_value,
         )
 
+    @patch("boto3.Session")
+    @patch("pydantic_ai.providers.bedrock.BedrockProvider")
+    @patch("pydantic_ai.models.bedrock.BedrockConverseModel")
+    def test_iam_client_reused_for_same_credentials(self, mock_model_cls, mock_provider_cls, mock_session_cls):
+        """The bedrock-runtime client is built once per credential set."""
+        from module_identifier.llm.providers import _create_bedrock_model
+
+        config = LLMConfig(
+            provider="bedrock",
+            model_name="us.anthropic.claude-sonnet-4-5-20250929-v1:0",
+            aws_region_name="us-east-1",
+            aws_access_key_id="AKID",
+            aws_secret_access_key="secret",
+        )
+        _create_bedrock_model(config)
+        _create_bedrock_model(config)
+
+        mock_session_cls.assert_called_once()
+
+    @patch("boto3.Session")
+    @patch("pydantic_ai.providers.bedrock.BedrockProvider")
+    @patch("pydantic_ai.models.bedrock.BedrockConverseModel")
+    def test_iam_client_enables_keepalive(self, mock_model_cls, mock_provider_cls, mock_session_cls):
+        from module_identifier.llm.providers import _create_bedrock_model
+
+        config = LLMConfig(
+            provider="bedrock",
+            model_name="us.anthropic.claude-sonnet-4-5-20250929-v1:0",
+            aws_region_name="us-east-1",
+            aws_access_key_id="AKID",
+            aws_secret_access_key="secret",
+        )
+        _create_bedrock_model(config)
+
+        client_call = mock_session_cls.return_value.client.call_args
+        assert client_call.args == ("bedrock-runtime",)
+        boto_config = client_call.kwargs["config"]
+        assert boto_config.tcp_keepalive is True
+        assert boto_config.read_timeout == 300
+
 
 class TestContrastModelCreation:
     @patch("anthropic.AsyncAnthropic")
@@ -176,3 +241,18 @@ class TestContrastModelCreation:
 
         call_kwargs = mock_client_cls.call_args[1]
         assert call_kwargs["base_url"] == "https://app.contrastsecurity.com/api/llm-proxy/v2/organizations/test-org-id/anthropic"
+
+    @patch("anthropic.AsyncAnthropic")
+    @patch("pydantic_ai.providers.anthropic.AnthropicProvider")
+    @patch("pydantic_ai.models.anthropic.AnthropicModel")
+    def test_models_share_client_for_same_account(
+        self, mock_model_cls, mock_provider_cls, mock_client_cls
+    ):
+        from module_identifier.llm.providers import _create_contrast_model
+
+        cc = _make_contrast_config()
+        _create_contrast_model(LLMConfig(provider="contrast", model_name="model-a"), cc)
+        _create_contrast_model(LLMConfig(provider="contrast", model_name="model-b"), cc)
+
+        mock_client_cls.assert_called_once()
+        assert mock_model_cls.call_count == 2
@@ -32,7 +32,7 @@ def _patch_configs(monkeypatch):
         staticmethod(lambda: _CONTRAST_CONFIG),
     )
     monkeypatch.setattr(
-        "module_identifier.__main__.LLMConfig.from_env",
+        "module_identifier.llm.config.LLMConfig.from_env",
         staticmethod(lambda: _LLM_CONFIG),
     )
 
@@ -61,7 +61,7 @@ def _run_main_single_ok(monkeypatch, capsys):
 
 
 class TestMcpConnectionRefused:
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_connection_refused_clean_exit(self, mock_identify, monkeypatch, capsys):
         mock_identify.side_effect = ConnectionRefusedError("Connection refused")
 
@@ -70,7 +70,7 @@ class TestMcpConnectionRefused:
         assert code == 1
         assert "Cannot connect to Contrast MCP server" in stderr
 
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_connection_error_clean_exit(self, mock_identify, monkeypatch, capsys):
         mock_identify.side_effect = ConnectionError("Network unreachable")
 
@@ -81,7 +81,7 @@ class TestMcpConnectionRefused:
 
 
 class TestMcpAuthFailure:
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_mcp_error_clean_exit(self, mock_identify, monkeypatch, capsys):
         mock_identify.side_effect = McpError(
             ErrorData(code=-32600, message="Authentication failed")
@@ -95,7 +95,7 @@ class TestMcpAuthFailure:
 
 
 class TestMcpServerStartFailure:
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_file_not_found_clean_exit(self, mock_identify, monkeypatch, capsys):
         mock_identify.side_effect = FileNotFoundError("java not found")
 
@@ -104,7 +104,7 @@ class TestMcpServerStartFailure:
         assert code == 1
         assert "Cannot start Contrast MCP server" in stderr
 
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_os_error_clean_exit(self, mock_identify, monkeypatch, capsys):
         mock_identify.side_effect = OSError("No such process")
 
@@ -115,7 +115,7 @@ class TestMcpServerStartFailure:
 
 
 class TestFilesystemErrors:
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_permission_error_clean_exit(self, mock_identify, monkeypatch, capsys):
         mock_identify.side_effect = PermissionError("Permission denied")
 
@@ -126,7 +126,7 @@ class TestFilesystemErrors:
 
 
 class TestTimeoutErrors:
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_timeout_clean_exit(self, mock_identify, monkeypatch, capsys):
         mock_identify.side_effect = TimeoutError()
 
@@ -137,7 +137,7 @@ class TestTimeoutErrors:
 
 
 class TestUnexpectedErrors:
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_unexpected_error_clean_exit(self, mock_identify, monkeypatch, capsys):
         mock_identify.side_effect = RuntimeError("something broke")
 
@@ -153,19 +153,19 @@ class TestUnexpectedErrors:
 
 
 class TestNoMatchNoCrash:
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_empty_repo_no_crash(self, mock_identify, monkeypatch, capsys):
         """Empty repo: identify_repo returns None, CLI completes normally."""
         mock_identify.return_value = None
         _run_main_single_ok(monkeypatch, capsys)
 
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_zero_candidates_no_crash(self, mock_identify, monkeypatch, capsys):
         """Uninstrumented app: modules found but no Contrast apps → None, no crash."""
         mock_identify.return_value = None
         _run_main_single_ok(monkeypatch, capsys)
 
-    @patch("module_identifier.__main__.identify_repo")
+    @patch("module_identifier.identify.identify_repo")
     def test_candidates_no_match_no_crash(self, mock_identify, monkeypatch, capsys):
         """Candidates exist but none match → None, no crash."""
         mock_identify.return_value = None
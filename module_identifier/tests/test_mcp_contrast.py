@@ -3,9 +3,14 @@
 import json
 from dataclasses import dataclass
 from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
 
 from module_identifier.config import ContrastConfig
-from module_identifier.mcp_contrast import _has_more_pages, _parse_candidates, _server_params
+from module_identifier.mcp_contrast import (
+    ContrastMCP, _default_jar_path, _parse_candidates, _parse_page, _server_params,
+)
 
 
 # --- Helpers ---
@@ -127,6 +132,16 @@ class TestParseCandidates:
         result = _mcp_result(json.dumps(data))
         assert _parse_candidates(result) == []
 
+    def test_empty_app_id_falls_back_to_next_key(self):
+        data = [{"appID": "", "id": "abc", "name": "my-app"}]
+        result = _mcp_result(json.dumps(data))
+        assert [c.app_id for c in _parse_candidates(result)] == ["abc"]
+
+    def test_numeric_zero_app_id_kept(self):
+        data = [{"id": 0, "name": "my-app"}]
+        result = _mcp_result(json.dumps(data))
+        assert [c.app_id for c in _parse_candidates(result)] == ["0"]
+
     def test_missing_language_defaults_empty(self):
         data = [{"name": "my-app", "appID": "abc-123"}]
         result = _mcp_result(json.dumps(data))
@@ -157,25 +172,52 @@ class TestParseCandidates:
         assert candidates[0].name == "real-app"
 
 
-# --- _has_more_pages ---
+# --- hasMorePages ---
 
 
 class TestHasMorePages:
     def test_has_more_true(self):
         result = _mcp_result(json.dumps({"items": [], "hasMorePages": True}))
-        assert _has_more_pages(result) is True
+        assert _parse_page(result)[1] is True
 
     def test_has_more_false(self):
         result = _mcp_result(json.dumps({"items": [], "hasMorePages": False}))
-        assert _has_more_pages(result) is False
+        assert _parse_page(result)[1] is False
 
     def test_missing_field_defaults_false(self):
         result = _mcp_result(json.dumps({"items": []}))
-        assert _has_more_pages(result) is False
+        assert _parse_page(result)[1] is False
 
     def test_plain_list_returns_false(self):
         result = _mcp_result(json.dumps([{"name": "app", "appID": "1"}]))
-        assert _has_more_pages(result) is False
+        assert _parse_page(result)[1] is False
+
+
+# --- _parse_page ---
+
+
+class TestParsePage:
+    def test_single_pass_returns_candidates_flag_and_size(self):
+        text = json.dumps({"items": [{"name": "app", "appID": "1"}], "hasMorePages": True})
+        result = _mcp_result(text)
+        with patch("module_identifier.mcp_contrast._json_loads", wraps=json.loads) as loads:
+            candidates, has_more, raw_bytes = _parse_page(result)
+        assert [c.app_id for c in candidates] == ["1"]
+        assert has_more is True
+        assert raw_bytes == len(text)
+        loads.assert_called_once()
+
+    def test_languages_share_one_object(self):
+        text = json.dumps([
+            {"name": "a", "appID": "1", "language": "Java"},
+            {"name": "b", "appID": "2", "language": "Java"},
+        ])
+        first, second = _parse_page(_mcp_result(text))[0]
+        assert first.language is second.language
+
+    def test_unparseable_text_still_counted(self):
+        candidates, has_more, raw_bytes = _parse_page(_mcp_result("oops"))
+        assert (candidates, has_more, raw_bytes) == ([], False, 4)
 
 
 # --- _server_params ---
@@ -208,3 +250,68 @@ class TestServerParams:
         assert params.env["CONTRAST_HOST_NAME"] == "test.contrastsecurity.com"
         assert params.env["CONTRAST_API_KEY"] == "key"
         assert params.env["CONTRAST_ORG_ID"] == "org-123"
+
+    def test_default_jar_path_follows_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("MCP_CONTRAST_JAR_PATH", raising=False)
+        assert _default_jar_path() == ""
+
+        monkeypatch.setenv("MCP_CONTRAST_JAR_PATH", str(tmp_path / "mcp.jar"))
+        assert _default_jar_path() == str((tmp_path / "mcp.jar").resolve())
+
+
+# --- list_applications ---
+
+
+class _PagedSession:
+    """Fake ClientSession serving `total` pages of one app each; `failing` pages raise."""
+
+    def __init__(self, total: int, failing: frozenset[int] = frozenset()):
+        self.total = total
+        self.failing = failing
+        self.pages_requested: list[int] = []
+
+    async def call_tool(self, name, args):
+        page = args["page"]
+        self.pages_requested.append(page)
+        if page in self.failing:
+            raise TimeoutError(f"page {page}")
+        if page > self.total:
+            return _mcp_result(json.dumps({"items": [], "hasMorePages": False}))
+        return _mcp_result(json.dumps({
+            "items": [{"name": f"app-{page}", "appID": str(page)}],
+            "hasMorePages": page < self.total,
+        }))
+
+
+def _connected(session) -> ContrastMCP:
+    mcp = ContrastMCP(_fake_config())
+    mcp._session = session
+    mcp._call_count = 0
+    mcp._total_candidates = 0
+    mcp._total_time = 0.0
+    return mcp
+
+
+class TestListApplications:
+    async def test_single_page_makes_one_call(self):
+        session = _PagedSession(total=1)
+        apps = await _connected(session).list_applications()
+        assert [a.app_id for a in apps] == ["1"]
+        assert session.pages_requested == [1]
+
+    async def test_pages_fetched_in_concurrent_batches_and_kept_in_order(self):
+        session = _PagedSession(total=7)
+        apps = await _connected(session).list_applications()
+        assert [a.app_id for a in apps] == [str(p) for p in range(1, 8)]
+        # 1, then batches 2-5 and 6-9; pages past the last are discarded
+        assert sorted(session.pages_requested) == list(range(1, 10))
+
+    async def test_failure_past_last_page_ignored(self):
+        session = _PagedSession(total=3, failing=frozenset({4, 5}))
+        apps = await _connected(session).list_applications()
+        assert [a.app_id for a in apps] == ["1", "2", "3"]
+
+    async def test_failure_on_real_page_raised(self):
+        session = _PagedSession(total=3, failing=frozenset({3}))
+        with pytest.raises(TimeoutError, match="page 3"):
+            await _connected(session).list_applications()
@@ -1,5 +1,7 @@
 """Tests for pipeline LLM integration — mocked agent, real pipeline logic."""
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, patch, MagicMock
 import pytest
 
@@ -35,6 +37,35 @@ class TestPipelineResult:
         result = PipelineResult(matched={}, unmatched=[], total=0)
         assert result.llm_matched == {}
 
+    def test_as_payload(self):
+        det = MagicMock(app_id="app-1", app_name="order-api", confidence=1.0, search_term="order-api")
+        llm = LLMMatch(
+            application_id="app-99",
+            application_name="mystery-service",
+            confidence="LOW",
+            reasoning="Guess",
+        )
+        unmatched = ["tools/codegen"]
+        result = PipelineResult(
+            matched={"services/order": det},
+            unmatched=unmatched,
+            llm_matched={"libs/mystery": llm},
+            total=3,
+        )
+
+        payload = result.as_payload()
+
+        assert payload["total_modules"] == 3
+        assert payload["deterministic_matched"]["services/order"] == {
+            "app_id": "app-1", "app_name": "order-api",
+            "confidence": 1.0, "search_term": "order-api",
+        }
+        assert payload["llm_matched"]["libs/mystery"] == {
+            "app_id": "app-99", "app_name": "mystery-service",
+            "confidence": "LOW", "reasoning": "Guess",
+        }
+        assert payload["unmatched"] is unmatched
+
 
 class TestPipelineLLMIntegration:
     @pytest.fixture
@@ -85,6 +116,28 @@ class TestPipelineLLMIntegration:
         assert result.llm_matched["libs/mystery"].application_name == "mystery-service"
         assert result.unmatched == []
 
+    async def test_discovery_error_cancels_app_fetch(self, mock_discover, mock_mcp):
+        """A failed walk stops the in-flight MCP fetch before the error propagates."""
+        fetch_started = threading.Event()
+
+        async def hang():
+            fetch_started.set()
+            await asyncio.Event().wait()
+
+        def discover(*args, **kwargs):
+            fetch_started.wait(timeout=5)
+            raise PermissionError("denied")
+
+        mock_discover.side_effect = discover
+        session = mock_mcp.return_value.__aenter__.return_value
+        session.list_applications = AsyncMock(side_effect=hang)
+
+        with pytest.raises(PermissionError):
+            await run("/tmp/repo", _contrast_config(), _llm_config())
+
+        mock_mcp.return_value.__aexit__.assert_awaited_once()
+        assert mock_mcp.return_value.__aexit__.await_args.args[0] is asyncio.CancelledError
+
     async def test_llm_still_unmatched(self, mock_discover, mock_mcp):
         """If LLM also can't resolve, module stays in unmatched."""
         mock_discover.return_value = [
@@ -1,9 +1,15 @@
 """Tests for module_identifier resolver (search term extraction, scoring, resolution)."""
 
+import dataclasses
+from unittest.mock import patch
+
+import pytest
+
 from module_identifier.models import DiscoveredModule, Ecosystem, Manifest
 from module_identifier.resolver import (
     AppCandidate,
     AppMatch,
+    candidate_scorer,
     extract_search_term,
     score_candidate,
     resolve_module,
@@ -80,6 +86,25 @@ class TestExtractSearchTerm:
         )
         assert extract_search_term(m) == "employee-management"
 
+    def test_cached_term_follows_module_fields(self):
+        m = _module("com.acme:order-api", Manifest.POM_XML, Ecosystem.JAVA)
+        assert extract_search_term(m) == "order-api"
+        m.contrast_app_name = "orders"
+        assert extract_search_term(m) == "orders"
+
+
+# --- AppCandidate ---
+
+
+class TestAppCandidate:
+    def test_equal_candidates_hash_together(self):
+        a = AppCandidate("id1", "order-api", "Java")
+        assert {a, AppCandidate("id1", "order-api", "Java")} == {a}
+
+    def test_immutable(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            AppCandidate("id1", "order-api", "Java").name = "other"
+
 
 # --- Tokenization ---
 
@@ -103,6 +128,13 @@ class TestTokenize:
     def test_empty(self):
         assert _tokenize("") == set()
 
+    def test_returns_frozenset(self):
+        assert isinstance(_tokenize("order-service"), frozenset)
+
+    def test_no_process_wide_cache(self):
+        """Token sets aren't retained between runs; the pack holds them per run."""
+        assert not hasattr(_tokenize, "cache_info")
+
 
 # --- Scoring ---
 
@@ -159,6 +191,18 @@ class TestScoreCandidate:
         score_java = score_candidate(m, c_java, "juice-shop")
         assert score_node > score_java
 
+    def test_bound_scorer_matches_score_candidate(self):
+        m = _module("juice-shop", Manifest.PACKAGE_JSON, Ecosystem.NODE)
+        candidates = [
+            AppCandidate("id1", "Juice-Shop", "Node"),
+            AppCandidate("id2", "my-juice-shop", "Java"),
+            AppCandidate("id3", "webgoat", "Node"),
+        ]
+        score_fn = candidate_scorer(m, "juice-shop")
+        assert [score_fn(c) for c in candidates] == [
+            score_candidate(m, c, "juice-shop") for c in candidates
+        ]
+
 
 # --- resolve_module ---
 
@@ -233,6 +277,14 @@ class TestResolveModule:
 
 
 class TestResolveModules:
+    def test_each_app_name_tokenized_once_per_run(self):
+        modules = [_module(f"svc-{i}", Manifest.POM_XML, Ecosystem.JAVA, path=f"m{i}") for i in range(3)]
+        apps = [AppCandidate(f"id{i}", f"app-{i}", "Java") for i in range(5)]
+        with patch("module_identifier.resolver._tokenize", wraps=_tokenize) as tokenize:
+            resolve_modules(modules, apps)
+        # one per app (packed once) plus one per module search term
+        assert tokenize.call_count == len(apps) + len(modules)
+
     def test_maps_all_modules(self):
         modules = [
             _module("webgoat-server", Manifest.POM_XML, Ecosystem.JAVA, path="backend"),
@@ -257,6 +309,37 @@ class TestResolveModules:
         result = resolve_modules([], [])
         assert result == {}
 
+    def test_indexed_matches_unindexed(self):
+        modules = [
+            _module("order-api", Manifest.POM_XML, Ecosystem.JAVA, path="a"),
+            _module("billing", Manifest.PACKAGE_JSON, Ecosystem.NODE, path="b"),
+        ]
+        apps = [
+            AppCandidate("id1", "Order-API", "Node"),
+            AppCandidate("id2", "order_api", "Java"),
+            AppCandidate("id3", "billing-ui", "Node"),
+            AppCandidate("id4", "unrelated", "Node"),
+        ]
+        for threshold in (0.1, 0.5, 0.9):
+            assert resolve_modules(modules, apps, threshold) == {
+                m.path: resolve_module(m, apps, threshold) for m in modules
+            }
+
+    def test_confidence_counts_tokens_unknown_to_candidates(self):
+        """Module tokens no candidate has still enlarge the Jaccard union."""
+        module = _module("order-extra", Manifest.POM_XML, Ecosystem.JAVA, path="a")
+        app = AppCandidate("id1", "order-api", "Java")
+        match = resolve_modules([module], [app], 0.1)["a"]
+        assert match.confidence == score_candidate(module, app, "order-extra")
+        assert match.confidence == pytest.approx(0.7 / 3 + 0.2)
+
+    def test_language_only_candidate_matches_low_threshold(self):
+        """Below the language bonus, candidates sharing no tokens still count."""
+        modules = [_module("order-api", Manifest.POM_XML, Ecosystem.JAVA, path="a")]
+        apps = [AppCandidate("id1", "webgoat", "Java")]
+        assert resolve_modules(modules, apps, 0.5)["a"] is None
+        assert resolve_modules(modules, apps, 0.1)["a"].app_id == "id1"
+
 
 # --- Fork naming (AIML-475) ---
 
@@ -84,6 +84,29 @@ class TestNameFromPomXml:
 <project><groupId>com.example</groupId></project>""")
         assert _name_from_pom_xml(pom) is None
 
+    def test_parent_coordinates_ignored(self, tmp_repo):
+        pom = tmp_repo / "pom.xml"
+        pom.write_text("""<?xml version="1.0"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <parent>
+        <groupId>com.parent</groupId>
+        <artifactId>parent-pom</artifactId>
+    </parent>
+    <artifactId>my-app</artifactId>
+</project>""")
+        assert _name_from_pom_xml(pom) == "my-app"
+
+    def test_stops_after_coordinates(self, tmp_repo):
+        """Content after groupId/artifactId is never parsed."""
+        pom = tmp_repo / "pom.xml"
+        pom.write_text("""<?xml version="1.0"?>
+<project>
+    <groupId>com.example</groupId>
+    <artifactId>my-app</artifactId>
+    <dependencies><unclosed>
+</project>""")
+        assert _name_from_pom_xml(pom) == "com.example:my-app"
+
 
 class TestNameFromGoMod:
     def test_extracts_module(self, tmp_repo):
@@ -96,6 +119,11 @@ class TestNameFromGoMod:
         mod.write_text("")
         assert _name_from_go_mod(mod) is None
 
+    def test_module_after_comments_crlf(self, tmp_repo):
+        mod = tmp_repo / "go.mod"
+        mod.write_bytes(b"// generated\r\nmodule example.com/svc\r\n\r\ngo 1.22\r\n")
+        assert _name_from_go_mod(mod) == "example.com/svc"
+
 
 class TestNameFromComposerJson:
     def test_extracts_name(self, tmp_repo):
@@ -309,6 +337,59 @@ class TestDiscoverModules:
         assert root.contrast_app_name == "root-app"
         assert api.contrast_app_name is None
 
+    def test_manifest_directory_is_not_a_manifest(self, tmp_repo):
+        (tmp_repo / "package.json").mkdir()
+        assert discover_modules(tmp_repo) == []
+
+    def test_symlinked_manifest_detected(self, tmp_repo):
+        real = tmp_repo / "shared.json"
+        real.write_text(json.dumps({"name": "linked"}))
+        app = tmp_repo / "app"
+        app.mkdir()
+        (app / "package.json").symlink_to(real)
+        modules = discover_modules(tmp_repo)
+        assert [(m.name, m.path) for m in modules] == [("linked", "app")]
+
+    def test_symlink_outside_repo_skipped(self, tmp_path):
+        repo = tmp_path / "repo"
+        outside = tmp_path / "outside"
+        repo.mkdir()
+        outside.mkdir()
+        (outside / "package.json").write_text(json.dumps({"name": "escaped"}))
+        (repo / "link").symlink_to(outside)
+        assert discover_modules(repo) == []
+
+    def test_symlinked_directory_scanned_once(self, tmp_repo):
+        api = tmp_repo / "services" / "api"
+        api.mkdir(parents=True)
+        (api / "package.json").write_text(json.dumps({"name": "api"}))
+        (tmp_repo / "zz-alias").symlink_to(api)
+        modules = discover_modules(tmp_repo)
+        assert [m.path for m in modules] == ["services/api"]
+
+    def test_symlink_cycle_not_followed(self, tmp_repo):
+        (tmp_repo / "go.mod").write_text("module root\n")
+        (tmp_repo / "loop").symlink_to(tmp_repo)
+        modules = discover_modules(tmp_repo)
+        assert [m.path for m in modules] == ["."]
+
+    def test_subdirectories_scanned_in_name_order(self, tmp_repo):
+        for name in ("zeta", "alpha", "mid"):
+            (tmp_repo / name).mkdir()
+            (tmp_repo / name / "go.mod").write_text(f"module {name}\n")
+        modules = discover_modules(tmp_repo)
+        assert [m.path for m in modules] == ["alpha", "mid", "zeta"]
+
+    def test_results_in_depth_first_order(self, tmp_repo):
+        """Level-by-level parallel scan still yields a depth-first walk's order."""
+        for rel in ("b", "a/y", "a", "a/x/deep", "c/z"):
+            d = tmp_repo / rel
+            d.mkdir(parents=True, exist_ok=True)
+            (d / "go.mod").write_text(f"module {rel}\n")
+        (tmp_repo / "go.mod").write_text("module root\n")
+        modules = discover_modules(tmp_repo)
+        assert [m.path for m in modules] == [".", "a", "a/x/deep", "a/y", "b", "c/z"]
+
 
 # --- Contrast YAML parsing ---
 
@@ -341,6 +422,19 @@ class TestContrastAppName:
     def test_no_yaml_returns_none(self, tmp_repo):
         assert _contrast_app_name(tmp_repo) is None
 
+    def test_uses_given_file_listing(self, tmp_repo):
+        (tmp_repo / "contrast.yaml").write_text(
+            "application:\n  name: alt-app\n"
+        )
+        assert _contrast_app_name(tmp_repo, {"contrast.yaml"}) == "alt-app"
+        assert _contrast_app_name(tmp_repo, set()) is None
+
+    def test_crlf_line_endings(self, tmp_repo):
+        (tmp_repo / "contrast_security.yaml").write_bytes(
+            b"application:\r\n  name: my-app\r\n"
+        )
+        assert _contrast_app_name(tmp_repo) == "my-app"
+
     def test_yaml_without_application_block(self, tmp_repo):
         (tmp_repo / "contrast_security.yaml").write_text(
             "api:\n  url: https://example.com\n"